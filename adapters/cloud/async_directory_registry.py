@@ -0,0 +1,222 @@
+"""
+Async Cloud Directory Registry
+
+Asynchronous variant of the Trust Directory registry, built on httpx.
+Lets callers fan out many agent lookups concurrently over a shared
+HTTP/2 connection pool instead of serializing on blocking requests.
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Union
+import httpx
+import orjson
+from cachetools import TTLCache
+from adapters.cloud.directory_registry import _AGENT_ID_RE
+
+logger = logging.getLogger(__name__)
+
+# Result handed to single-flight followers when the leader was cancelled
+_LEADER_CANCELLED = object()
+
+
+class AsyncCloudDirectoryRegistry:
+    """
+    Async Trust Directory client for cloud mode.
+    
+    Mirrors CloudDirectoryRegistry but exposes coroutine methods:
+    - await find_agent(agent_id)
+    - await find_agents([agent_id, ...]) for bounded concurrent lookups
+    - await find_service(service_id)
+    - await list_agents()
+    
+    Implements caching with 5-minute TTL for agents and service contracts.
+    """
+    
+    CACHE_TTL = 300  # 5 minutes
+    CACHE_MAXSIZE = 10_000
+    MAX_CONCURRENCY = 32
+    
+    def __init__(self, directory_url: str, timeout: int = 10):
+        """
+        Initialize the async cloud directory registry.
+        
+        Args:
+            directory_url: URL of the Amorce Trust Directory API
+            timeout: Request timeout in seconds
+        """
+        if not directory_url:
+            raise ValueError("TRUST_DIRECTORY_URL is required for cloud mode")
+        
+        self.directory_url = directory_url.rstrip('/')
+        self.timeout = timeout
+        
+        # Bounded caches (only touched from the event loop, so no locking)
+        self._agent_cache: TTLCache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        self._service_cache: TTLCache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        # Single-flight: one upstream lookup per agent_id at a time
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        self._client = httpx.AsyncClient(
+            base_url=self.directory_url,
+            http2=True,
+            timeout=self.timeout,
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+        
+        logger.info(f"Async cloud registry initialized: {self.directory_url}")
+    
+    async def find_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find an agent by querying the Trust Directory API.
+        
+        Args:
+            agent_id: The agent identifier
+        
+        Returns:
+            Agent metadata or None if not found/inactive
+        """
+        if not _AGENT_ID_RE.fullmatch(agent_id):
+            logger.debug(f"Rejected malformed agent_id: {agent_id!r}")
+            return None
+        
+        # Check cache first
+        cached = self._agent_cache.get(agent_id)
+        if cached is not None:
+            logger.debug(f"Cache hit for agent {agent_id}")
+            return cached
+        
+        # Coalesce concurrent misses: followers await the leader's lookup
+        future = self._inflight.get(agent_id)
+        if future is not None:
+            data = await asyncio.shield(future)
+            if data is _LEADER_CANCELLED:
+                # The leader was cancelled, not this caller: start over
+                return await self.find_agent(agent_id)
+            return data
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[agent_id] = future
+        try:
+            data = await self._fetch_agent(agent_id)
+        except BaseException:
+            # Only cancellation can get here (_fetch_agent swallows errors);
+            # the followers were not cancelled, so wake them to retry
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        finally:
+            del self._inflight[agent_id]
+        future.set_result(data)
+        return data
+    
+    async def _fetch_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Query the Trust Directory for an agent and update the cache."""
+        try:
+            resp = await self._client.get(f"/api/v1/lookup/{agent_id}")
+            
+            if resp.status_code != 200:
+                logger.warning(f"Trust Directory lookup failed for {agent_id}: {resp.status_code}")
+                return None
+            
+            data = orjson.loads(resp.content)
+            
+            # Check if agent is active
+            if data.get("status") != "active":
+                logger.warning(f"Agent {agent_id} is not active (status: {data.get('status')})")
+                return None
+            
+            self._agent_cache[agent_id] = data
+            
+            return data
+        
+        except httpx.HTTPError as e:
+            logger.error(f"Error querying Trust Directory for agent {agent_id}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return None
+    
+    async def find_agents(self, agent_ids: List[str]) -> List[Union[Optional[Dict[str, Any]], BaseException]]:
+        """
+        Look up several agents concurrently.
+        
+        At most MAX_CONCURRENCY lookups are in flight at once.
+        
+        Args:
+            agent_ids: Agent identifiers to resolve
+        
+        Returns:
+            Results in the same order as agent_ids (agent metadata, None,
+            or the exception raised for that lookup)
+        """
+        async def _bounded(agent_id: str) -> Optional[Dict[str, Any]]:
+            async with self._semaphore:
+                return await self.find_agent(agent_id)
+        
+        tasks = [_bounded(agent_id) for agent_id in agent_ids]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def find_service(self, service_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a service contract by querying the Trust Directory API.
+        
+        Args:
+            service_id: The service identifier
+        
+        Returns:
+            Service contract or None if not found
+        """
+        if not _AGENT_ID_RE.fullmatch(service_id):
+            logger.debug(f"Rejected malformed service_id: {service_id!r}")
+            return None
+        
+        cached = self._service_cache.get(service_id)
+        if cached is not None:
+            logger.debug(f"Cache hit for service {service_id}")
+            return cached
+        
+        try:
+            resp = await self._client.get(f"/api/v1/services/{service_id}")
+            
+            if resp.status_code != 200:
+                logger.warning(f"Service lookup failed for {service_id}: {resp.status_code}")
+                return None
+            
+            data = orjson.loads(resp.content)
+            self._service_cache[service_id] = data
+            return data
+        
+        except httpx.HTTPError as e:
+            logger.error(f"Error querying Trust Directory for service {service_id}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return None
+    
+    async def list_agents(self) -> list[Dict[str, Any]]:
+        """
+        List all agents from the Trust Directory.
+        
+        Returns:
+            List of agent metadata dictionaries
+        """
+        try:
+            resp = await self._client.get("/api/v1/agents")
+            
+            if resp.status_code != 200:
+                logger.error(f"Failed to list agents: {resp.status_code}")
+                return []
+            
+            return orjson.loads(resp.content).get("agents", [])
+        
+        except Exception as e:
+            logger.error(f"Error listing agents: {e}")
+            return []
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        await self._client.aclose()
+
@@ -5,14 +5,24 @@ Queries the Amorce Trust Directory API for agent discovery and public keys.
 This is the registry implementation for cloud mode.
 """
 
+import re
 import requests
-import time
+import threading
 import logging
+from concurrent.futures import Future
 from typing import Optional, Dict, Any, Tuple
+import orjson
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from core.interfaces import IAgentRegistry
 
 logger = logging.getLogger(__name__)
 
+# Valid agent/service identifiers (use fullmatch); anything else is rejected
+# without a lookup
+_AGENT_ID_RE = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
 
 class CloudDirectoryRegistry(IAgentRegistry):
     """
@@ -22,12 +32,19 @@ class CloudDirectoryRegistry(IAgentRegistry):
     - Agent lookup (public keys, endpoints)
     - Service contract lookup
     
-    Implements caching with 5-minute TTL.
+    Implements caching with 5-minute TTL for agents and service contracts,
+    plus a short negative cache for unknown/inactive agents. Once an entry
+    expires it is revalidated with If-None-Match against the last ETag, so
+    unchanged records come back as a body-less 304.
     """
     
-    # Cache: {agent_id: (data, timestamp)}
-    _agent_cache: Dict[str, Tuple[Dict, float]] = {}
     CACHE_TTL = 300  # 5 minutes
+    NEGATIVE_CACHE_TTL = 30  # seconds
+    CACHE_MAXSIZE = 10_000
+    
+    # Connection pool sizing (per registry instance)
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
     
     def __init__(self, directory_url: str, timeout: int = 10):
         """
@@ -42,6 +59,31 @@ class CloudDirectoryRegistry(IAgentRegistry):
         
         self.directory_url = directory_url.rstrip('/')
         self.timeout = timeout
+        self._lookup_tpl = self.directory_url + "/api/v1/lookup/{}"
+        self._service_tpl = self.directory_url + "/api/v1/services/{}"
+        
+        # Per-instance caches: {agent_id: data} / {agent_id: True}
+        self._cache: TTLCache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        self._neg_cache: TTLCache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.NEGATIVE_CACHE_TTL)
+        self._service_cache: TTLCache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        # Validators outlive the TTL cache: {cache_key: (etag, data)}
+        self._etags: LRUCache = LRUCache(maxsize=self.CACHE_MAXSIZE)
+        self._lock = threading.Lock()
+        
+        # Single-flight: one upstream lookup per agent_id at a time
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Pooled session: reuses TCP/TLS connections across lookups
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept"] = "application/json"
         
         logger.info(f"Cloud registry initialized: {self.directory_url}")
     
@@ -55,32 +97,68 @@ class CloudDirectoryRegistry(IAgentRegistry):
         Returns:
             Agent metadata or None if not found/inactive
         """
-        # Check cache first
-        cached = self._agent_cache.get(agent_id)
-        if cached and (time.time() - cached[1]) < self.CACHE_TTL:
+        if not _AGENT_ID_RE.fullmatch(agent_id):
+            logger.debug(f"Rejected malformed agent_id: {agent_id!r}")
+            return None
+        
+        # Check caches first (TTLCache is not thread-safe)
+        with self._lock:
+            if agent_id in self._neg_cache:
+                logger.debug(f"Negative cache hit for agent {agent_id}")
+                return None
+            cached = self._cache.get(agent_id)
+        if cached is not None:
             logger.debug(f"Cache hit for agent {agent_id}")
-            return cached[0]
+            return cached
+        
+        # Coalesce concurrent misses: followers wait on the leader's lookup
+        with self._inflight_lock:
+            future = self._inflight.get(agent_id)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[agent_id] = future
+        
+        if not leader:
+            logger.debug(f"Waiting on in-flight lookup for agent {agent_id}")
+            return future.result()
         
-        # Query the Trust Directory
         try:
-            url = f"{self.directory_url}/api/v1/lookup/{agent_id}"
+            data = self._fetch_agent(agent_id)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(agent_id, None)
+    
+    def _fetch_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Query the Trust Directory for an agent and update the caches."""
+        try:
+            url = self._lookup_tpl.format(agent_id)
             logger.debug(f"Querying Trust Directory: {url}")
             
-            resp = requests.get(url, timeout=self.timeout)
+            status, data = self._conditional_get(url, f"agent:{agent_id}")
             
-            if resp.status_code != 200:
-                logger.warning(f"Trust Directory lookup failed for {agent_id}: {resp.status_code}")
+            if status != 200:
+                logger.warning(f"Trust Directory lookup failed for {agent_id}: {status}")
+                if status == 404:
+                    with self._lock:
+                        self._neg_cache[agent_id] = True
                 return None
             
-            data = resp.json()
-            
             # Check if agent is active
             if data.get("status") != "active":
                 logger.warning(f"Agent {agent_id} is not active (status: {data.get('status')})")
+                with self._lock:
+                    self._neg_cache[agent_id] = True
                 return None
             
             # Cache the result
-            self._agent_cache[agent_id] = (data, time.time())
+            with self._lock:
+                self._cache[agent_id] = data
             
             return data
             
@@ -101,17 +179,30 @@ class CloudDirectoryRegistry(IAgentRegistry):
         Returns:
             Service contract or None if not found
         """
+        if not _AGENT_ID_RE.fullmatch(service_id):
+            logger.debug(f"Rejected malformed service_id: {service_id!r}")
+            return None
+        
+        with self._lock:
+            cached = self._service_cache.get(service_id)
+        if cached is not None:
+            logger.debug(f"Cache hit for service {service_id}")
+            return cached
+        
         try:
-            url = f"{self.directory_url}/api/v1/services/{service_id}"
+            url = self._service_tpl.format(service_id)
             logger.debug(f"Querying Trust Directory for service: {url}")
             
-            resp = requests.get(url, timeout=self.timeout)
+            status, data = self._conditional_get(url, f"service:{service_id}")
             
-            if resp.status_code != 200:
-                logger.warning(f"Service lookup failed for {service_id}: {resp.status_code}")
+            if status != 200:
+                logger.warning(f"Service lookup failed for {service_id}: {status}")
                 return None
             
-            return resp.json()
+            with self._lock:
+                self._service_cache[service_id] = data
+            
+            return data
             
         except requests.RequestException as e:
             logger.error(f"Error querying Trust Directory for service {service_id}: {e}")
@@ -131,15 +222,51 @@ class CloudDirectoryRegistry(IAgentRegistry):
             url = f"{self.directory_url}/api/v1/agents"
             logger.debug(f"Listing all agents from Trust Directory: {url}")
             
-            resp = requests.get(url, timeout=self.timeout)
+            status, data = self._conditional_get(url, "agents")
             
-            if resp.status_code != 200:
-                logger.error(f"Failed to list agents: {resp.status_code}")
+            if status != 200:
+                logger.error(f"Failed to list agents: {status}")
                 return []
             
-            data = resp.json()
             return data.get("agents", [])
             
         except Exception as e:
             logger.error(f"Error listing agents: {e}")
             return []
+    
+    def _conditional_get(self, url: str, cache_key: str) -> Tuple[int, Any]:
+        """
+        GET a JSON resource, revalidating against the last seen ETag.
+        
+        Args:
+            url: Resource URL
+            cache_key: Key under which the ETag and decoded body are kept
+        
+        Returns:
+            (status_code, decoded body); a 304 is reported as 200 with the
+            previously decoded body, any other non-200 status with None
+        """
+        with self._lock:
+            validator = self._etags.get(cache_key)
+        
+        headers = {"If-None-Match": validator[0]} if validator else None
+        resp = self.session.get(url, headers=headers, timeout=self.timeout)
+        
+        if resp.status_code == 304 and validator is not None:
+            logger.debug(f"Not modified: {url}")
+            return 200, validator[1]
+        if resp.status_code != 200:
+            return resp.status_code, None
+        
+        data = orjson.loads(resp.content)
+        etag = resp.headers.get("ETag")
+        with self._lock:
+            if etag:
+                self._etags[cache_key] = (etag, data)
+            else:
+                self._etags.pop(cache_key, None)
+        return 200, data
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
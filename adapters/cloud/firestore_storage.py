@@ -6,12 +6,33 @@ This is the storage implementation for cloud mode.
 """
 
 import logging
-from typing import Optional, Dict, Any
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterator
+from google.api_core import exceptions as gcp_exceptions
 from google.cloud import firestore
+from google.cloud.firestore_v1.bulk_writer import BulkRetry, BulkWriterOptions
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 from core.interfaces import IStorage
 
 logger = logging.getLogger(__name__)
 
+# Errors worth retrying a WriteBatch commit on
+_TRANSIENT_ERRORS = (
+    gcp_exceptions.ServiceUnavailable,
+    gcp_exceptions.DeadlineExceeded,
+    gcp_exceptions.Aborted,
+    gcp_exceptions.InternalServerError,
+)
+
+
+def _chunks(items: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield successive slices of at most `size` items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 
 class FirestoreStorage(IStorage):
     """
@@ -21,37 +42,87 @@ class FirestoreStorage(IStorage):
     - Metering and billing
     - Audit trails
     - Analytics
+    
+    Transaction writes are enqueued in memory and committed in batches
+    through a BulkWriter by a background thread, keeping Firestore off
+    the request path. The Firestore client itself is created on first use.
     """
     
+    # Background flusher: commit every N docs or T seconds, whichever first
+    FLUSH_BATCH_SIZE = 400
+    FLUSH_INTERVAL = 0.2
+    QUEUE_MAXSIZE = 10_000
+    
     def __init__(self, project_id: str, collection_name: str = "ledger"):
         """
         Initialize Firestore storage.
         
+        The Firestore client is not built here; see db_client.
+        
         Args:
             project_id: Google Cloud project ID
             collection_name: Firestore collection name
         """
-        try:
-            self.db_client = firestore.Client(project=project_id)
-            self.collection_name = collection_name
-            logger.info(f"Firestore storage initialized: {project_id}/{collection_name}")
-        except Exception as e:
-            logger.error(f"Failed to initialize Firestore: {e}")
-            raise
+        self.project_id = project_id
+        self.collection_name = collection_name
+        self._client: Optional[firestore.Client] = None
+        self._bulk_writer = None
+        self._client_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._closed = False
+        # Orders enqueues against close(): nothing lands behind the stop sentinel
+        self._enqueue_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._drain, name="firestore-ledger-flusher", daemon=True)
+        self._worker.start()
+    
+    @property
+    def db_client(self) -> firestore.Client:
+        """Firestore client (and its BulkWriter), created on first access."""
+        client = self._client
+        if client is not None:
+            return client
+        
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    client = firestore.Client(project=self.project_id)
+                    self._bulk_writer = client.bulk_writer(
+                        options=BulkWriterOptions(retry=BulkRetry.exponential)
+                    )
+                    self._client = client
+                    logger.info(f"Firestore storage initialized: {self.project_id}/{self.collection_name}")
+                except Exception as e:
+                    logger.error(f"Failed to initialize Firestore: {e}")
+                    raise
+            return self._client
     
     def log_transaction(self, tx_data: Dict[str, Any]) -> None:
         """
         Log a transaction to Firestore.
         
+        Enqueues the transaction for the background flusher and returns
+        immediately. If the queue is full (or closed), falls back to a
+        direct synchronous write.
+        
         Args:
             tx_data: Transaction data dictionary
         """
+        transaction_id = tx_data.get("transaction_id")
+        if not transaction_id:
+            logger.error("Cannot log transaction without transaction_id")
+            return
+        
+        with self._enqueue_lock:
+            if not self._closed:
+                try:
+                    self._queue.put_nowait(tx_data)
+                    return
+                except queue.Full:
+                    logger.warning("Firestore ledger queue full - writing transaction synchronously")
+        
         try:
-            transaction_id = tx_data.get("transaction_id")
-            if not transaction_id:
-                logger.error("Cannot log transaction without transaction_id")
-                return
-            
             doc_ref = self.db_client.collection(self.collection_name).document(transaction_id)
             doc_ref.set({
                 **tx_data,
@@ -63,6 +134,148 @@ class FirestoreStorage(IStorage):
             logger.error(f"Failed to log transaction to Firestore: {e}")
             # Don't raise - logging failures shouldn't break the transaction
     
+    def log_transactions(self, tx_list: List[Dict[str, Any]]) -> None:
+        """
+        Log several transactions to Firestore through the BulkWriter.
+        
+        Args:
+            tx_list: List of transaction data dictionaries
+        """
+        try:
+            collection = self.db_client.collection(self.collection_name)
+            count = 0
+            with self._writer_lock:
+                for tx_data in tx_list:
+                    transaction_id = tx_data.get("transaction_id")
+                    if not transaction_id:
+                        logger.error("Cannot log transaction without transaction_id")
+                        continue
+                    
+                    self._bulk_writer.set(collection.document(transaction_id), {
+                        **tx_data,
+                        "ingested_at": firestore.SERVER_TIMESTAMP
+                    })
+                    count += 1
+                
+                self._bulk_writer.flush()
+            logger.debug(f"{count} transactions logged to Firestore")
+        except Exception as e:
+            logger.error(f"Failed to log transactions to Firestore: {e}")
+            # Don't raise - logging failures shouldn't break the transaction
+    
+    def log_transactions_parallel(self, tx_list: List[Dict[str, Any]],
+                                  batch_size: int = 40, workers: int = 10) -> None:
+        """
+        Bulk-ingest transactions as WriteBatches committed from a thread pool.
+        
+        Intended for backfills and imports; request-path logging should keep
+        using log_transaction().
+        
+        Args:
+            tx_list: List of transaction data dictionaries
+            batch_size: Documents per WriteBatch (Firestore caps this at 500)
+            workers: Number of concurrent commits
+        """
+        valid = [tx for tx in tx_list if tx.get("transaction_id")]
+        if len(valid) != len(tx_list):
+            logger.error(f"Skipping {len(tx_list) - len(valid)} transactions without transaction_id")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(self._commit_chunk, _chunks(valid, batch_size)))
+            logger.debug(f"{len(valid)} transactions logged to Firestore (parallel)")
+        except Exception as e:
+            logger.error(f"Failed to log transactions to Firestore: {e}")
+    
+    @retry(
+        retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=0.1, max=5),
+        reraise=True
+    )
+    def _commit_chunk(self, chunk: List[Dict[str, Any]]) -> None:
+        """Commit one chunk of transactions as a single WriteBatch."""
+        collection = self.db_client.collection(self.collection_name)
+        batch = self.db_client.batch()
+        for tx_data in chunk:
+            batch.set(collection.document(tx_data["transaction_id"]), {
+                **tx_data,
+                "ingested_at": firestore.SERVER_TIMESTAMP
+            })
+        batch.commit()
+    
+    def _drain(self) -> None:
+        """Background loop: batch queued transactions and commit them."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            
+            batch, markers = [], []
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            stop = False
+            while True:
+                if isinstance(item, threading.Event):
+                    # flush() marker: commit what came before it right away
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.FLUSH_BATCH_SIZE:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+            
+            if batch:
+                self.log_transactions(batch)
+            for marker in markers:
+                marker.set()
+            for _ in range(len(batch) + len(markers) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+    
+    def flush(self) -> None:
+        """
+        Block until every transaction queued before this call is written.
+        
+        Waits on a marker behind those rows rather than for the queue to
+        empty, so steady writes cannot starve the caller.
+        """
+        marker = threading.Event()
+        while True:
+            with self._enqueue_lock:
+                if self._closed or not self._worker.is_alive():
+                    return
+                try:
+                    self._queue.put_nowait(marker)
+                    break
+                except queue.Full:
+                    pass
+            # Queue full: give the flusher a batch interval to catch up
+            time.sleep(self.FLUSH_INTERVAL)
+        marker.wait()
+    
+    def close(self) -> None:
+        """Drain the queue, stop the flusher and close the BulkWriter."""
+        with self._enqueue_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+        if self._bulk_writer is not None:
+            with self._writer_lock:
+                self._bulk_writer.close()
+    
     def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a transaction from Firestore.
@@ -73,6 +286,9 @@ class FirestoreStorage(IStorage):
         Returns:
             Transaction data or None if not found
         """
+        # Read-your-writes: push out anything still buffered
+        self.flush()
+        
         try:
             doc_ref = self.db_client.collection(self.collection_name).document(transaction_id)
             doc = doc_ref.get()
@@ -85,12 +301,13 @@ class FirestoreStorage(IStorage):
             logger.error(f"Failed to retrieve transaction from Firestore: {e}")
             return None
     
-    def store_approval(self, approval_data: Dict[str, Any]) -> None:
+    def store_approval(self, approval_data: Dict[str, Any], merge: bool = False) -> None:
         """
         Store an approval request in Firestore.
         
         Args:
             approval_data: Approval data dictionary
+            merge: Merge into an existing document instead of replacing it
         """
         try:
             approval_id = approval_data.get("approval_id")
@@ -102,13 +319,35 @@ class FirestoreStorage(IStorage):
             doc_ref.set({
                 **approval_data,
                 "updated_at": firestore.SERVER_TIMESTAMP
-            })
+            }, merge=merge)
             
             logger.debug(f"Approval stored in Firestore: {approval_id}")
         except Exception as e:
             logger.error(f"Failed to store approval in Firestore: {e}")
             # Don't raise - storage failures shouldn't break the flow
     
+    def store_approval_update(self, approval_id: str, partial: Dict[str, Any]) -> None:
+        """
+        Update only the given fields of an existing approval.
+        
+        Sends just the changed fields instead of rewriting the document,
+        so concurrent updates to other fields are not clobbered.
+        
+        Args:
+            approval_id: The approval identifier
+            partial: Fields to update
+        """
+        try:
+            doc_ref = self.db_client.collection("approvals").document(approval_id)
+            doc_ref.update({
+                **partial,
+                "updated_at": firestore.SERVER_TIMESTAMP
+            })
+            
+            logger.debug(f"Approval updated in Firestore: {approval_id}")
+        except Exception as e:
+            logger.error(f"Failed to update approval in Firestore: {e}")
+    
     def get_approval(self, approval_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve an approval from Firestore.
@@ -133,11 +372,12 @@ class FirestoreStorage(IStorage):
     
     # --- Payment Methods (Phase 3 - Dormant) ---
     
-    def store_payment(self, payment_data: Dict[str, Any]) -> None:
+    def store_payment(self, payment_data: Dict[str, Any], merge: bool = False) -> None:
         """
         Store a payment record in Firestore (Phase 3 feature - dormant).
         
-        Collection exists but feature is not enabled yet.
+        Collection exists but feature is not enabled yet. Pass merge=True
+        to merge into an existing document instead of replacing it.
         """
         try:
             payment_id = payment_data.get("payment_id")
@@ -149,7 +389,7 @@ class FirestoreStorage(IStorage):
             doc_ref.set({
                 **payment_data,
                 "updated_at": firestore.SERVER_TIMESTAMP
-            })
+            }, merge=merge)
             
             logger.debug(f"Payment stored in Firestore: {payment_id}")
         except Exception as e:
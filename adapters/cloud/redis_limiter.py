@@ -6,27 +6,65 @@ This is the rate limiter for cloud mode.
 """
 
 import logging
+import socket
+import time
 import redis
 from core.interfaces import IRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Atomic token bucket, one round-trip per check.
+# KEYS[1] = bucket hash, ARGV = limit, window (s), now (ms)
+# Returns {allowed (0/1), retry_after (s), tokens left}
+_TOKEN_BUCKET_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2]) * 1000
+local now = tonumber(ARGV[3])
+local rate = limit / window_ms
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local last = tonumber(state[2])
+if tokens == nil then
+    tokens = limit
+    last = now
+end
+
+tokens = math.min(limit, tokens + math.max(0, now - last) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = math.ceil((1 - tokens) / rate / 1000)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], window_ms)
+return {allowed, retry_after, math.floor(tokens)}
+"""
+
 
 class RedisRateLimiter(IRateLimiter):
     """
     Redis-based rate limiter for cloud mode.
     
-    Implements a simple counter-based rate limiting strategy:
-    - Each agent gets a counter in Redis
-    - Counter increments on each request
-    - Counter expires after the time window
-    - Requests are blocked if counter exceeds limit
+    Implements a token bucket strategy:
+    - Each agent gets a bucket of `limit` tokens in Redis
+    - Tokens refill continuously at limit/window per second
+    - Each request consumes one token
+    - Requests are blocked when the bucket is empty
+    
+    Unlike a fixed-window counter, this cannot burst 2x limit across a
+    window boundary. The whole check runs as one atomic Lua script.
     
     Fail-open design: If Redis is unavailable, allows traffic through.
     """
     
     def __init__(self, redis_host: str = "localhost", redis_port: int = 6379, 
-                 redis_db: int = 0, fail_open: bool = True):
+                 redis_db: int = 0, fail_open: bool = True, max_connections: int = 64):
         """
         Initialize Redis rate limiter.
         
@@ -35,18 +73,30 @@ class RedisRateLimiter(IRateLimiter):
             redis_port: Redis server port
             redis_db: Redis database number
             fail_open: If True, allow traffic when Redis is unavailable
+            max_connections: Connection pool size (match worker concurrency)
         """
         self.fail_open = fail_open
         
+        # TCP_KEEPIDLE is Linux-specific
+        keepalive_options = {}
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            keepalive_options[socket.TCP_KEEPIDLE] = 30
+        
         try:
-            self.redis_client = redis.Redis(
+            pool = redis.ConnectionPool(
                 host=redis_host,
                 port=redis_port,
                 db=redis_db,
+                max_connections=max_connections,
                 socket_connect_timeout=0.1,
+                socket_keepalive=True,
+                socket_keepalive_options=keepalive_options,
+                health_check_interval=30,
                 decode_responses=True
             )
+            self.redis_client = redis.Redis(connection_pool=pool)
             self.redis_client.ping()
+            self._bucket_script = self.redis_client.register_script(_TOKEN_BUCKET_SCRIPT)
             logger.info(f"Redis rate limiter initialized: {redis_host}:{redis_port}")
             self.redis_available = True
         except Exception as e:
@@ -56,7 +106,7 @@ class RedisRateLimiter(IRateLimiter):
             self.redis_available = False
             self.redis_client = None
     
-    def check_limit(self, agent_id: str, limit: int = 10, window: int = 60) -> bool:
+    def check_limit(self, agent_id: str, limit: int = 10, window: int = 60) -> tuple[bool, int]:
         """
         Check if an agent is within rate limits.
         
@@ -66,35 +116,36 @@ class RedisRateLimiter(IRateLimiter):
             window: Time window in seconds
             
         Returns:
-            True if within limits
+            (allowed, retry_after) - retry_after is the seconds until the
+            bucket refills one token when the limit is exceeded (at least
+            1), else 0
             
         Raises:
-            Exception if limit exceeded (for fail-fast behavior)
+            Exception if Redis is unavailable and fail_open is disabled
         """
         if not self.redis_available:
             if self.fail_open:
-                return True
+                return True, 0
             raise Exception("Rate limiting service unavailable")
         
-        key = f"rate_limit:{agent_id}"
+        key = f"tb:{agent_id}"
         
         try:
-            current_count = self.redis_client.incr(key)
-            
-            # Set expiry on first request
-            if current_count == 1:
-                self.redis_client.expire(key, window)
+            now_ms = int(time.time() * 1000)
+            allowed, retry_after, remaining = self._bucket_script(
+                keys=[key], args=[limit, window, now_ms]
+            )
             
-            if current_count > limit:
-                logger.warning(f"⛔ RATE LIMIT EXCEEDED for {agent_id}: {current_count}/{limit}")
-                raise Exception(f"Rate limit exceeded ({limit} req/{window}s)")
+            if not allowed:
+                logger.warning(f"⛔ RATE LIMIT EXCEEDED for {agent_id}: {limit} req/{window}s")
+                return False, max(int(retry_after), 1)
             
-            logger.debug(f"Rate limit check for {agent_id}: {current_count}/{limit}")
-            return True
+            logger.debug(f"Rate limit check for {agent_id}: {remaining}/{limit} tokens left")
+            return True, 0
             
         except redis.RedisError as e:
             logger.error(f"Redis runtime error: {e}")
             if self.fail_open:
                 logger.warning("Redis error - allowing traffic (fail-open)")
-                return True
+                return True, 0
             raise
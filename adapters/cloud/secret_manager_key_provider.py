@@ -6,6 +6,8 @@ This is the key provider for cloud mode.
 """
 
 import logging
+import threading
+from typing import Optional
 from core.interfaces import IKeyProvider
 from amorce import GoogleSecretManagerProvider, IdentityManager
 
@@ -18,12 +20,20 @@ class GoogleSecretKeyProvider(IKeyProvider):
     
     Fetches Ed25519 private keys from GCP Secret Manager.
     Uses the amorce SDK's built-in GoogleSecretManagerProvider.
+    
+    The secret is fetched lazily on first use (not at construction), then
+    refreshed in the background every REFRESH_INTERVAL seconds so key
+    rotations are picked up without blocking callers.
     """
     
+    REFRESH_INTERVAL = 1800  # 30 minutes
+    
     def __init__(self, project_id: str, secret_name: str, agent_id: str):
         """
         Initialize the Google Secret Manager key provider.
         
+        No network I/O happens here; the secret is fetched on first use.
+        
         Args:
             project_id: Google Cloud project ID
             secret_name: Secret Manager secret name
@@ -32,20 +42,53 @@ class GoogleSecretKeyProvider(IKeyProvider):
         self.project_id = project_id
         self.secret_name = secret_name
         self.agent_id_value = agent_id
-        self._identity_manager: IdentityManager = None
-        
-        logger.info(f"Loading identity from Secret Manager: {secret_name}")
+        self._identity_manager: Optional[IdentityManager] = None
+        self._lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+    
+    def _fetch_identity(self) -> IdentityManager:
+        """Fetch the secret and build a fresh IdentityManager."""
+        logger.info(f"Loading identity from Secret Manager: {self.secret_name}")
+        provider = GoogleSecretManagerProvider(
+            project_id=self.project_id,
+            secret_name=self.secret_name
+        )
+        return IdentityManager(provider)
+    
+    def _ensure_identity(self) -> IdentityManager:
+        """Return the IdentityManager, fetching it on first call."""
+        identity = self._identity_manager
+        if identity is not None:
+            return identity
         
+        with self._lock:
+            if self._identity_manager is None:
+                try:
+                    self._identity_manager = self._fetch_identity()
+                    logger.info("Identity loaded successfully from Secret Manager")
+                except Exception as e:
+                    logger.error(f"Failed to load identity from Secret Manager: {e}")
+                    raise
+                self._schedule_refresh()
+            return self._identity_manager
+    
+    def _schedule_refresh(self) -> None:
+        """Arm the background refresh timer."""
+        self._refresh_timer = threading.Timer(self.REFRESH_INTERVAL, self._refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _refresh(self) -> None:
+        """Re-fetch the secret and swap it in; keep the old key on failure."""
         try:
-            provider = GoogleSecretManagerProvider(
-                project_id=project_id,
-                secret_name=secret_name
-            )
-            self._identity_manager = IdentityManager(provider)
-            logger.info("Identity loaded successfully from Secret Manager")
+            identity = self._fetch_identity()
+            with self._lock:
+                self._identity_manager = identity
+            logger.info("Identity refreshed from Secret Manager")
         except Exception as e:
-            logger.error(f"Failed to load identity from Secret Manager: {e}")
-            raise
+            logger.error(f"Failed to refresh identity from Secret Manager: {e}")
+        finally:
+            self._schedule_refresh()
     
     def load_private_key(self) -> bytes:
         """
@@ -57,12 +100,9 @@ class GoogleSecretKeyProvider(IKeyProvider):
         Raises:
             Exception if key cannot be loaded
         """
-        if not self._identity_manager:
-            raise Exception("Identity manager not initialized")
-        
         # The IdentityManager handles the key internally
         # We return the raw private key bytes for compatibility
-        return self._identity_manager.private_key
+        return self._ensure_identity().private_key
     
     def get_agent_id(self) -> str:
         """
@@ -80,4 +120,9 @@ class GoogleSecretKeyProvider(IKeyProvider):
         Returns:
             IdentityManager instance
         """
-        return self._identity_manager
+        return self._ensure_identity()
+    
+    def close(self) -> None:
+        """Stop the background refresh timer."""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
@@ -6,7 +6,8 @@ Loads private keys from PEM files on disk.
 
 import os
 import logging
-from typing import Optional
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from core.interfaces import IKeyProvider
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,8 @@ class LocalFileKeyProvider(IKeyProvider):
     File-based private key provider for standalone mode.
     
     Loads Ed25519 private keys from local PEM files.
+    The PEM is parsed once at construction; signers should use
+    get_private_key_obj() rather than re-parsing key bytes per call.
     """
     
     def __init__(self, key_file: str, agent_id: str):
@@ -26,40 +29,52 @@ class LocalFileKeyProvider(IKeyProvider):
         Args:
             key_file: Path to the PEM file containing the private key
             agent_id: The agent ID associated with this key
+        
+        Raises:
+            FileNotFoundError if the key file does not exist
+            Exception if the key cannot be parsed
         """
         self.key_file = key_file
         self.agent_id_value = agent_id
-        self._private_key: Optional[bytes] = None
         
         if not os.path.exists(key_file):
             raise FileNotFoundError(f"Private key file not found: {key_file}")
         
+        try:
+            with open(key_file, 'rb') as f:
+                pem_data = f.read()
+            
+            self._private_key_obj: ed25519.Ed25519PrivateKey = serialization.load_pem_private_key(
+                pem_data, password=None
+            )
+            self._private_key_bytes: bytes = self._private_key_obj.private_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PrivateFormat.Raw,
+                encryption_algorithm=serialization.NoEncryption()
+            )
+        except Exception as e:
+            logger.error(f"Failed to load private key: {e}")
+            raise
+        
         logger.info(f"Loaded private key from {key_file}")
     
     def load_private_key(self) -> bytes:
         """
-        Load the private key from the PEM file.
+        Load the private key.
         
         Returns:
-            Private key bytes
-            
-        Raises:
-            Exception if key cannot be loaded
+            Raw 32-byte Ed25519 private key (parsed once at init)
         """
-        if self._private_key:
-            return self._private_key
+        return self._private_key_bytes
+    
+    def get_private_key_obj(self) -> ed25519.Ed25519PrivateKey:
+        """
+        Get the parsed private key object, ready for signing.
         
-        try:
-            with open(self.key_file, 'rb') as f:
-                pem_data = f.read()
-            
-            # The amorce SDK will handle PEM parsing
-            # For now, we return the raw bytes
-            self._private_key = pem_data
-            return self._private_key
-        except Exception as e:
-            logger.error(f"Failed to load private key: {e}")
-            raise
+        Returns:
+            Ed25519PrivateKey instance
+        """
+        return self._private_key_obj
     
     def get_agent_id(self) -> str:
         """
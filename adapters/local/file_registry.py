@@ -5,10 +5,11 @@ Reads agent and service data from JSON configuration files.
 This is the default registry for standalone mode.
 """
 
-import json
 import logging
+import mmap
 import os
 from typing import Optional, Dict, Any
+import orjson
 from core.interfaces import IAgentRegistry
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,13 @@ class LocalFileRegistry(IAgentRegistry):
     Reads from:
     - config/agents.json: Agent registry (ID, public key, endpoint)
     - config/services.json: Service contracts (ID, provider, path template)
+    
+    Agents files larger than STREAM_THRESHOLD bytes are stream-parsed from
+    an mmap with ijson instead of being loaded in one piece.
     """
     
+    STREAM_THRESHOLD = 16 * 1024 * 1024  # 16 MB
+    
     def __init__(self, agents_file: str = "./config/agents.json", 
                  services_file: str = "./config/services.json"):
         """
@@ -37,40 +43,116 @@ class LocalFileRegistry(IAgentRegistry):
         self._agents: Dict[str, Dict[str, Any]] = {}
         self._services: Dict[str, Dict[str, Any]] = {}
         
+        # Active-agent index, rebuilt whenever agents are (re)loaded
+        self._active_agents: list[Dict[str, Any]] = []
+        self._active_by_id: Dict[str, Dict[str, Any]] = {}
+        
+        # st_mtime_ns of the last successfully parsed files
+        self._agents_mtime: Optional[int] = None
+        self._services_mtime: Optional[int] = None
+        
         self._load_agents()
         self._load_services()
     
     def _load_agents(self) -> None:
-        """Load agents from JSON file."""
-        if not os.path.exists(self.agents_file):
+        """Load agents from JSON file (skipped if the file is unchanged)."""
+        try:
+            stat = os.stat(self.agents_file)
+            mtime = stat.st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"Agents file not found: {self.agents_file}")
             logger.info("Creating empty agents registry.")
             self._agents = {}
+            self._agents_mtime = None
+            self._index_agents()
+            return
+        
+        if mtime == self._agents_mtime:
             return
         
+        if stat.st_size > self.STREAM_THRESHOLD:
+            try:
+                self._stream_agents()
+                self._agents_mtime = mtime
+                logger.info(f"Streamed {len(self._agents)} agents from {self.agents_file}")
+                return
+            except Exception as e:
+                logger.error(f"Failed to load agents file: {e}")
+                self._agents = {}
+                self._agents_mtime = None
+                self._index_agents()
+                return
+        
         try:
-            with open(self.agents_file, 'r') as f:
-                self._agents = json.load(f)
+            with open(self.agents_file, 'rb') as f:
+                self._agents = orjson.loads(f.read())
+            self._agents_mtime = mtime
             logger.info(f"Loaded {len(self._agents)} agents from {self.agents_file}")
         except Exception as e:
             logger.error(f"Failed to load agents file: {e}")
             self._agents = {}
+            self._agents_mtime = None
+        
+        self._index_agents()
+    
+    def _stream_agents(self) -> None:
+        """
+        Stream-parse a large agents file from an mmap.
+        
+        Builds the agent map and the active index in a single pass without
+        materializing the whole document as a string first.
+        """
+        # Only needed for very large registries
+        import ijson
+        
+        agents: Dict[str, Dict[str, Any]] = {}
+        active_by_id: Dict[str, Dict[str, Any]] = {}
+        
+        fd = os.open(self.agents_file, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                for agent_id, agent in ijson.kvitems(mm, '', use_float=True):
+                    agents[agent_id] = agent
+                    if agent.get("metadata", {}).get("status", "active") == "active":
+                        active_by_id[agent_id] = agent
+        finally:
+            os.close(fd)
+        
+        self._agents = agents
+        self._active_by_id = active_by_id
+        self._active_agents = list(active_by_id.values())
+    
+    def _index_agents(self) -> None:
+        """Precompute the active agents so lookups skip the status checks."""
+        self._active_by_id = {
+            agent_id: agent for agent_id, agent in self._agents.items()
+            if agent.get("metadata", {}).get("status", "active") == "active"
+        }
+        self._active_agents = list(self._active_by_id.values())
     
     def _load_services(self) -> None:
-        """Load services from JSON file."""
-        if not os.path.exists(self.services_file):
+        """Load services from JSON file (skipped if the file is unchanged)."""
+        try:
+            mtime = os.stat(self.services_file).st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"Services file not found: {self.services_file}")
             logger.info("Creating empty services registry.")
             self._services = {}
+            self._services_mtime = None
+            return
+        
+        if mtime == self._services_mtime:
             return
         
         try:
-            with open(self.services_file, 'r') as f:
-                self._services = json.load(f)
+            with open(self.services_file, 'rb') as f:
+                self._services = orjson.loads(f.read())
+            self._services_mtime = mtime
             logger.info(f"Loaded {len(self._services)} services from {self.services_file}")
         except Exception as e:
             logger.error(f"Failed to load services file: {e}")
             self._services = {}
+            self._services_mtime = None
     
     def find_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -82,19 +164,18 @@ class LocalFileRegistry(IAgentRegistry):
         Returns:
             Agent metadata or None if not found/inactive
         """
-        agent = self._agents.get(agent_id)
+        agent = self._active_by_id.get(agent_id)
+        if agent:
+            return agent
         
+        # Miss: work out why, for the log
+        agent = self._agents.get(agent_id)
         if not agent:
             logger.warning(f"Agent not found: {agent_id}")
-            return None
-        
-        # Check if agent is active
-        status = agent.get("metadata", {}).get("status", "active")
-        if status != "active":
+        else:
+            status = agent.get("metadata", {}).get("status", "active")
             logger.warning(f"Agent {agent_id} is not active (status: {status})")
-            return None
-        
-        return agent
+        return None
     
     def find_service(self, service_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -121,14 +202,14 @@ class LocalFileRegistry(IAgentRegistry):
         Returns:
             List of agent metadata dictionaries
         """
-        active_agents = [
-            agent for agent in self._agents.values()
-            if agent.get("metadata", {}).get("status", "active") == "active"
-        ]
-        return active_agents
+        return list(self._active_agents)
     
     def reload(self) -> None:
-        """Reload agents and services from files (for hot-reload)."""
+        """
+        Reload agents and services from files (for hot-reload).
+        
+        Files whose mtime has not changed since the last load are not re-parsed.
+        """
         logger.info("Reloading agent and service registries...")
         self._load_agents()
         self._load_services()
@@ -4,11 +4,8 @@ No-Op Rate Limiter
 Disables rate limiting for local development.
 """
 
-import logging
 from core.interfaces import IRateLimiter
 
-logger = logging.getLogger(__name__)
-
 
 class NoOpRateLimiter(IRateLimiter):
     """
@@ -16,13 +13,13 @@ class NoOpRateLimiter(IRateLimiter):
     
     Always allows traffic through without any limits.
     This is appropriate for local development and testing.
-    """
     
-    def __init__(self):
-        """Initialize the no-op rate limiter."""
-        logger.info("Rate limiting disabled (NoOpRateLimiter)")
+    Use the shared NOOP_LIMITER instance; callers on the hot path can
+    compare against it (`limiter is NOOP_LIMITER`) and skip the call.
+    """
     
-    def check_limit(self, agent_id: str, limit: int = 10, window: int = 60) -> bool:
+    @staticmethod
+    def check_limit(agent_id: str, limit: int = 10, window: int = 60) -> tuple[bool, int]:
         """
         Check rate limit (always passes).
         
@@ -32,7 +29,11 @@ class NoOpRateLimiter(IRateLimiter):
             window: Time window in seconds (ignored)
             
         Returns:
-            Always returns True
+            Always returns (True, 0)
         """
         # No rate limiting in standalone mode
-        return True
+        return True, 0
+
+
+# Shared instance
+NOOP_LIMITER = NoOpRateLimiter()
@@ -5,22 +5,145 @@ Logs transactions to a local SQLite database for development and self-hosting.
 """
 
 import sqlite3
-import json
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
+import queue
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator
+import orjson
 from core.interfaces import IStorage
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning; journal_mode=WAL is persistent and set in _init_db
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Statements are kept as constants so the per-connection statement cache hits
+_SQL_INSERT_TX = (
+    "INSERT INTO transactions "
+    "(transaction_id, consumer_agent_id, service_id, status, timestamp, result) "
+    "VALUES (?, ?, ?, ?, COALESCE(?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now')), ?)"
+)
+_SQL_SELECT_TX = (
+    "SELECT transaction_id, consumer_agent_id, service_id, status, timestamp, result "
+    "FROM transactions WHERE transaction_id = ?"
+)
+_SQL_SELECT_TX_JSON = (
+    "SELECT json_object('transaction_id', transaction_id, "
+    "'consumer_agent_id', consumer_agent_id, 'service_id', service_id, "
+    "'status', status, 'timestamp', timestamp, "
+    "'result', json(COALESCE(result, '{}'))) "
+    "FROM transactions WHERE transaction_id = ?"
+)
+_SQL_UPSERT_APPROVAL = (
+    "INSERT OR REPLACE INTO approvals "
+    "(approval_id, transaction_id, agent_id, summary, details, status, "
+    "approved_by, approved_at, created_at, expires_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_SELECT_APPROVAL = (
+    "SELECT approval_id, transaction_id, agent_id, summary, details, status, "
+    "approved_by, approved_at, created_at, expires_at "
+    "FROM approvals WHERE approval_id = ?"
+)
+_SQL_UPSERT_PAYMENT = (
+    "INSERT OR REPLACE INTO payments "
+    "(payment_id, payment_request_id, transaction_id, payer_agent_id, "
+    "payee_agent_id, amount, currency, payment_method, payment_token, "
+    "status, created_at, authorized_at, captured_at, description) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_SELECT_PAYMENT = (
+    "SELECT payment_id, payment_request_id, transaction_id, payer_agent_id, "
+    "payee_agent_id, amount, currency, payment_method, payment_token, "
+    "status, created_at, authorized_at, captured_at, description "
+    "FROM payments WHERE payment_id = ?"
+)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a result/details blob to JSON text (non-str keys coerced like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _tx_params(tx_data: Dict[str, Any]) -> tuple:
+    """Bind parameters for _SQL_INSERT_TX."""
+    g = tx_data.get
+    return (
+        g("transaction_id"),
+        g("consumer_agent_id"),
+        g("service_id"),
+        g("status", "unknown"),
+        g("timestamp"),
+        _dumps(g("result", {}))
+    )
+
+
+def _approval_params(approval_data: Dict[str, Any]) -> tuple:
+    """Bind parameters for _SQL_UPSERT_APPROVAL."""
+    g = approval_data.get
+    return (
+        g("approval_id"),
+        g("transaction_id"),
+        g("agent_id"),
+        g("summary"),
+        _dumps(g("details", {})),
+        g("status", "pending"),
+        g("approved_by"),
+        g("approved_at"),
+        g("created_at"),
+        g("expires_at")
+    )
+
+
+def _payment_params(payment_data: Dict[str, Any]) -> tuple:
+    """Bind parameters for _SQL_UPSERT_PAYMENT."""
+    g = payment_data.get
+    return (
+        g("payment_id"),
+        g("payment_request_id"),
+        g("transaction_id"),
+        g("payer_agent_id"),
+        g("payee_agent_id"),
+        g("amount"),
+        g("currency", "USD"),
+        g("payment_method"),
+        g("payment_token"),
+        g("status", "pending"),
+        g("created_at"),
+        g("authorized_at"),
+        g("captured_at"),
+        g("description", "")
+    )
+
 
 class LocalSQLiteStorage(IStorage):
     """
     SQLite-based transaction storage for standalone mode.
     
     Creates a local database at data/transactions.db with transaction logs.
+    
+    Uses one shared write connection (serialized by a lock) and a pool of
+    read-only connections, so point reads never queue behind the writer.
+    
+    log_transaction() enqueues rows for a background flusher that
+    group-commits them (at most FLUSH_BATCH_SIZE rows or FLUSH_INTERVAL
+    seconds per commit). Pass sync=True to write immediately.
     """
     
+    # Group commit: one transaction every N rows or T seconds, whichever first
+    FLUSH_BATCH_SIZE = 500
+    FLUSH_INTERVAL = 0.05
+    
     def __init__(self, db_path: str = "./data/transactions.db"):
         """
         Initialize SQLite storage.
@@ -30,13 +153,94 @@ class LocalSQLiteStorage(IStorage):
         """
         self.db_path = db_path
         self._init_db()
+        
+        self._writer: Optional[sqlite3.Connection] = self._connect()
+        self._write_lock = threading.Lock()
+        
+        # Read-only connections, opened on demand up to _max_readers
+        self._readers: queue.Queue = queue.Queue()
+        self._max_readers = os.cpu_count() or 4
+        self._reader_count = 0
+        self._reader_count_lock = threading.Lock()
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        # Orders enqueues against close(): nothing lands behind the stop sentinel
+        self._enqueue_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._flusher, name="sqlite-ledger-flusher", daemon=True)
+        self._worker.start()
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a connection in autocommit mode with the tuning PRAGMAs applied.
+        
+        Connections may be used from any thread; callers serialize access
+        (the write lock, or exclusive checkout from the reader pool).
+        """
+        if read_only:
+            target, uri = Path(self.db_path).resolve().as_uri() + "?mode=ro", True
+        else:
+            target, uri = self.db_path, False
+        conn = sqlite3.connect(
+            target,
+            uri=uri,
+            isolation_level=None,
+            cached_statements=256,
+            check_same_thread=False
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _write_conn(self) -> sqlite3.Connection:
+        """
+        The shared write connection; call with _write_lock held.
+        
+        Reopened if a write arrives after close(), so late writes are
+        committed synchronously instead of being lost.
+        """
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection from the pool."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_count_lock:
+                grow = self._reader_count < self._max_readers
+                if grow:
+                    self._reader_count += 1
+            if grow:
+                try:
+                    conn = self._connect(read_only=True)
+                except Exception:
+                    with self._reader_count_lock:
+                        self._reader_count -= 1
+                    raise
+            else:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
     
     def _init_db(self) -> None:
         """Initialize the database schema."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
+            # Planner statistics are only (re)built when the composite
+            # indexes are created, not on every startup
+            had_indexes = cursor.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' "
+                "AND name IN ('idx_tx_agent_ts', 'idx_approval_agent_status')"
+            ).fetchone()[0] == 2
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS transactions (
                     transaction_id TEXT PRIMARY KEY,
@@ -49,16 +253,14 @@ class LocalSQLiteStorage(IStorage):
                 )
             ''')
             
-            # Create indexes for common queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_consumer_agent 
-                ON transactions(consumer_agent_id)
-            ''')
-            
+            # Create indexes for common queries; the composite index serves
+            # "latest transactions for agent X" and subsumes the agent index
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_timestamp 
-                ON transactions(timestamp)
+                CREATE INDEX IF NOT EXISTS idx_tx_agent_ts 
+                ON transactions(consumer_agent_id, timestamp DESC)
             ''')
+            cursor.execute("DROP INDEX IF EXISTS idx_consumer_agent")
+            cursor.execute("DROP INDEX IF EXISTS idx_timestamp")
             
             # Create approvals table for HITL
             cursor.execute('''
@@ -78,9 +280,10 @@ class LocalSQLiteStorage(IStorage):
             ''')
             
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_approval_agent 
-                ON approvals(agent_id)
+                CREATE INDEX IF NOT EXISTS idx_approval_agent_status 
+                ON approvals(agent_id, status)
             ''')
+            cursor.execute("DROP INDEX IF EXISTS idx_approval_agent")
             
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_approval_status 
@@ -118,6 +321,10 @@ class LocalSQLiteStorage(IStorage):
                 ON payments(status)
             ''')
             
+            # New composite indexes: gather statistics so the planner picks them
+            if not had_indexes:
+                cursor.execute("ANALYZE")
+            
             conn.commit()
             conn.close()
             
@@ -126,32 +333,28 @@ class LocalSQLiteStorage(IStorage):
             logger.error(f"Failed to initialize database: {e}")
             raise
     
-    def log_transaction(self, tx_data: Dict[str, Any]) -> None:
+    def log_transaction(self, tx_data: Dict[str, Any], sync: bool = False) -> None:
         """
         Log a transaction to the database.
         
         Args:
             tx_data: Transaction data dictionary
+            sync: Write immediately instead of queueing for the flusher
         """
+        if not sync:
+            with self._enqueue_lock:
+                if not self._closed:
+                    self._queue.put_nowait(tx_data)
+                    return
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO transactions 
-                (transaction_id, consumer_agent_id, service_id, status, timestamp, result)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                tx_data.get("transaction_id"),
-                tx_data.get("consumer_agent_id"),
-                tx_data.get("service_id"),
-                tx_data.get("status", "unknown"),
-                tx_data.get("timestamp", datetime.utcnow().isoformat()),
-                json.dumps(tx_data.get("result", {}))
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock:
+                conn = self._write_conn()
+                cursor = conn.cursor()
+                
+                cursor.execute(_SQL_INSERT_TX, _tx_params(tx_data))
+                
+                conn.commit()
             
             logger.debug(f"Transaction logged: {tx_data.get('transaction_id')}")
         except Exception as e:
@@ -168,33 +371,49 @@ class LocalSQLiteStorage(IStorage):
         Returns:
             Transaction data or None if not found
         """
+        self.flush()
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM transactions WHERE transaction_id = ?
-            ''', (transaction_id,))
-            
-            row = cursor.fetchone()
-            conn.close()
+            with self._reader() as conn:
+                row = conn.execute(_SQL_SELECT_TX, (transaction_id,)).fetchone()
             
-            if not row:
+            if row is None:
                 return None
             
+            transaction_id, consumer_agent_id, service_id, status, timestamp, result = row
             return {
-                "transaction_id": row["transaction_id"],
-                "consumer_agent_id": row["consumer_agent_id"],
-                "service_id": row["service_id"],
-                "status": row["status"],
-                "timestamp": row["timestamp"],
-                "result": json.loads(row["result"]) if row["result"] else {}
+                "transaction_id": transaction_id,
+                "consumer_agent_id": consumer_agent_id,
+                "service_id": service_id,
+                "status": status,
+                "timestamp": timestamp,
+                "result": orjson.loads(result) if result else {}
             }
         except Exception as e:
             logger.error(f"Failed to retrieve transaction: {e}")
             return None
     
+    def get_transaction_json(self, transaction_id: str) -> Optional[bytes]:
+        """
+        Retrieve a transaction already serialized as JSON by SQLite.
+        
+        For handlers that only forward the row, this skips building a dict
+        and re-encoding it in Python.
+        
+        Args:
+            transaction_id: The transaction identifier
+            
+        Returns:
+            UTF-8 JSON bytes or None if not found
+        """
+        self.flush()
+        try:
+            with self._reader() as conn:
+                row = conn.execute(_SQL_SELECT_TX_JSON, (transaction_id,)).fetchone()
+            return row[0].encode() if row else None
+        except Exception as e:
+            logger.error(f"Failed to retrieve transaction: {e}")
+            return None
+    
     def store_approval(self, approval_data: Dict[str, Any]) -> None:
         """
         Store an approval request in the database.
@@ -203,29 +422,13 @@ class LocalSQLiteStorage(IStorage):
             approval_data: Approval data dictionary
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO approvals 
-                (approval_id, transaction_id, agent_id, summary, details, status, 
-                 approved_by, approved_at, created_at, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                approval_data.get("approval_id"),
-                approval_data.get("transaction_id"),
-                approval_data.get("agent_id"),
-                approval_data.get("summary"),
-                json.dumps(approval_data.get("details", {})),
-                approval_data.get("status", "pending"),
-                approval_data.get("approved_by"),
-                approval_data.get("approved_at"),
-                approval_data.get("created_at"),
-                approval_data.get("expires_at")
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock:
+                conn = self._write_conn()
+                cursor = conn.cursor()
+                
+                cursor.execute(_SQL_UPSERT_APPROVAL, _approval_params(approval_data))
+                
+                conn.commit()
             
             logger.debug(f"Approval stored: {approval_data.get('approval_id')}")
         except Exception as e:
@@ -243,31 +446,27 @@ class LocalSQLiteStorage(IStorage):
             Approval data or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM approvals WHERE approval_id = ?
-            ''', (approval_id,))
+            with self._reader() as conn:
+                row = conn.execute(_SQL_SELECT_APPROVAL, (approval_id,)).fetchone()
             
-            row = cursor.fetchone()
-            conn.close()
-            
-            if not row:
+            if row is None:
                 return None
             
+            (
+                approval_id, transaction_id, agent_id, summary, details, status,
+                approved_by, approved_at, created_at, expires_at
+            ) = row
             return {
-                "approval_id": row["approval_id"],
-                "transaction_id": row["transaction_id"],
-                "agent_id": row["agent_id"],
-                "summary": row["summary"],
-                "details": json.loads(row["details"]) if row["details"] else {},
-                "status": row["status"],
-                "approved_by": row["approved_by"],
-                "approved_at": row["approved_at"],
-                "created_at": row["created_at"],
-                "expires_at": row["expires_at"]
+                "approval_id": approval_id,
+                "transaction_id": transaction_id,
+                "agent_id": agent_id,
+                "summary": summary,
+                "details": orjson.loads(details) if details else {},
+                "status": status,
+                "approved_by": approved_by,
+                "approved_at": approved_at,
+                "created_at": created_at,
+                "expires_at": expires_at
             }
         except Exception as e:
             logger.error(f"Failed to retrieve approval: {e}")
@@ -282,34 +481,13 @@ class LocalSQLiteStorage(IStorage):
         Table exists but feature is not enabled yet.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO payments 
-                (payment_id, payment_request_id, transaction_id, payer_agent_id, 
-                 payee_agent_id, amount, currency, payment_method, payment_token,
-                 status, created_at, authorized_at, captured_at, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                payment_data.get("payment_id"),
-                payment_data.get("payment_request_id"),
-                payment_data.get("transaction_id"),
-                payment_data.get("payer_agent_id"),
-                payment_data.get("payee_agent_id"),
-                payment_data.get("amount"),
-                payment_data.get("currency", "USD"),
-                payment_data.get("payment_method"),
-                payment_data.get("payment_token"),
-                payment_data.get("status", "pending"),
-                payment_data.get("created_at"),
-                payment_data.get("authorized_at"),
-                payment_data.get("captured_at"),
-                payment_data.get("description", "")
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock:
+                conn = self._write_conn()
+                cursor = conn.cursor()
+                
+                cursor.execute(_SQL_UPSERT_PAYMENT, _payment_params(payment_data))
+                
+                conn.commit()
             
             logger.debug(f"Payment stored: {payment_data.get('payment_id')}")
         except Exception as e:
@@ -322,36 +500,176 @@ class LocalSQLiteStorage(IStorage):
         Table exists but feature is not enabled yet.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM payments WHERE payment_id = ?
-            ''', (payment_id,))
+            with self._reader() as conn:
+                row = conn.execute(_SQL_SELECT_PAYMENT, (payment_id,)).fetchone()
             
-            row = cursor.fetchone()
-            conn.close()
-            
-            if not row:
+            if row is None:
                 return None
             
+            (
+                payment_id, payment_request_id, transaction_id, payer_agent_id,
+                payee_agent_id, amount, currency, payment_method, payment_token,
+                status, created_at, authorized_at, captured_at, description
+            ) = row
             return {
-                "payment_id": row["payment_id"],
-                "payment_request_id": row["payment_request_id"],
-                "transaction_id": row["transaction_id"],
-                "payer_agent_id": row["payer_agent_id"],
-                "payee_agent_id": row["payee_agent_id"],
-                "amount": row["amount"],
-                "currency": row["currency"],
-                "payment_method": row["payment_method"],
-                "payment_token": row["payment_token"],
-                "status": row["status"],
-                "created_at": row["created_at"],
-                "authorized_at": row["authorized_at"],
-                "captured_at": row["captured_at"],
-                "description": row["description"]
+                "payment_id": payment_id,
+                "payment_request_id": payment_request_id,
+                "transaction_id": transaction_id,
+                "payer_agent_id": payer_agent_id,
+                "payee_agent_id": payee_agent_id,
+                "amount": amount,
+                "currency": currency,
+                "payment_method": payment_method,
+                "payment_token": payment_token,
+                "status": status,
+                "created_at": created_at,
+                "authorized_at": authorized_at,
+                "captured_at": captured_at,
+                "description": description
             }
         except Exception as e:
             logger.error(f"Failed to retrieve payment: {e}")
             return None
+    
+    # --- Group Commit ---
+    
+    def _flusher(self) -> None:
+        """Background loop: drain queued transactions into batched commits."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            
+            batch, markers = [], []
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            stop = False
+            while True:
+                if isinstance(item, threading.Event):
+                    # flush() marker: commit what came before it right away
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.FLUSH_BATCH_SIZE:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+            
+            if batch:
+                try:
+                    self._write_many(_SQL_INSERT_TX, [_tx_params(t) for t in batch])
+                    logger.debug(f"{len(batch)} transactions flushed")
+                except Exception as e:
+                    # One bad row must not drop the whole batch
+                    logger.warning(f"Batched commit failed ({e}), retrying row by row")
+                    for tx_data in batch:
+                        self.log_transaction(tx_data, sync=True)
+            for marker in markers:
+                marker.set()
+            
+            for _ in range(len(batch) + len(markers) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+    
+    def flush(self) -> None:
+        """
+        Block until every transaction queued before this call is committed.
+        
+        Waits on a marker behind those rows rather than for the queue to
+        empty, so concurrent writers cannot starve the caller.
+        """
+        marker = threading.Event()
+        with self._enqueue_lock:
+            if self._closed or not self._worker.is_alive():
+                return
+            self._queue.put(marker)
+        marker.wait()
+    
+    def close(self) -> None:
+        """
+        Commit anything still queued and stop the flusher.
+        
+        Later writes are not queued: they reopen the connection and are
+        committed synchronously.
+        """
+        with self._enqueue_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+        
+        with self._write_lock:
+            self._writer.close()
+            self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._reader_count_lock:
+                self._reader_count -= 1
+    
+    # --- Bulk Methods ---
+    
+    def _write_many(self, sql: str, rows: List[tuple]) -> None:
+        """Run executemany for all rows inside one IMMEDIATE transaction."""
+        with self._write_lock:
+            conn = self._write_conn()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.executemany(sql, rows)
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+    
+    def log_transactions_bulk(self, txs: List[Dict[str, Any]]) -> None:
+        """
+        Log several transactions in a single database transaction.
+        
+        Args:
+            txs: List of transaction data dictionaries
+        """
+        try:
+            self._write_many(_SQL_INSERT_TX, [_tx_params(t) for t in txs])
+            logger.debug(f"{len(txs)} transactions logged")
+        except Exception as e:
+            logger.error(f"Failed to log transactions: {e}")
+            # Don't raise - logging failures shouldn't break the transaction
+    
+    def store_approvals_bulk(self, approvals: List[Dict[str, Any]]) -> None:
+        """
+        Store several approvals in a single database transaction.
+        
+        Args:
+            approvals: List of approval data dictionaries
+        """
+        try:
+            self._write_many(_SQL_UPSERT_APPROVAL, [_approval_params(a) for a in approvals])
+            logger.debug(f"{len(approvals)} approvals stored")
+        except Exception as e:
+            logger.error(f"Failed to store approvals: {e}")
+    
+    def store_payments_bulk(self, payments: List[Dict[str, Any]]) -> None:
+        """
+        Store several payment records in a single database transaction.
+        
+        Args:
+            payments: List of payment data dictionaries
+        """
+        try:
+            self._write_many(_SQL_UPSERT_PAYMENT, [_payment_params(p) for p in payments])
+            logger.debug(f"{len(payments)} payments stored")
+        except Exception as e:
+            logger.error(f"Failed to store payments: {e}")
@@ -1,14 +1,31 @@
 # Gunicorn configuration file for MCP Wrapper production deployment
 
 import multiprocessing
+import os
 
 # Server socket
 bind = "0.0.0.0:5001"
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"  # Can use 'gevent' for async if needed
-worker_connections = 1000
+# MCP handlers mostly wait on subprocess pipes, so one gevent worker per
+# CPU is enough; more workers only add RSS.
+workers = max(2, multiprocessing.cpu_count())
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = 4000
+
+# Load the app once in the master and fork it (copy-on-write). The MCP
+# server subprocess is only started on first use, i.e. per worker.
+preload_app = True
+
+# With a preloaded app, gevent must patch the stdlib before the app is
+# imported, or locks created at import time would block whole workers.
+if worker_class == "gevent":
+    from gevent import monkey
+    monkey.patch_all()
+
+# Recycle workers periodically to bound memory growth
+max_requests = 10000
+max_requests_jitter = 500
 timeout = 120
 keepalive = 5
 
@@ -46,6 +63,15 @@ def when_ready(server):
     """Called when the server is ready to serve requests."""
     server.log.info("MCP Wrapper is ready to serve requests")
 
+def post_worker_init(worker):
+    """Warm the MCP server pool in each worker before it takes traffic."""
+    wrapper = getattr(worker.wsgi, "extensions", {}).get("mcp_wrapper")
+    if wrapper is not None:
+        try:
+            wrapper.warmup()
+        except Exception as e:
+            worker.log.warning(f"MCP pool warmup failed, will retry on first request: {e}")
+
 def worker_int(worker):
     """Called when a worker receives the SIGINT or SIGQUIT signal."""
     worker.log.info("Worker received INT or QUIT signal")
@@ -10,33 +10,147 @@ Handles:
 """
 
 import asyncio
+import atexit
+import hashlib
 import logging
-import requests
+import logging.handlers
+import queue
 import subprocess
+import threading
 import time
-from flask import Flask, request, jsonify
+import httpx
+import orjson
+from flask import Flask, Response, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Production imports - use correct SDK path. Only fall back to adding the
+# repository root to sys.path when the SDK is not importable as installed.
+try:
+    from amorce.verification import verify_request
+    from amorce.exceptions import AmorceSecurityError
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    from amorce.verification import verify_request
+    from amorce.exceptions import AmorceSecurityError
 
-# Production imports - use correct SDK path
-from amorce.verification import verify_request
-from amorce.exceptions import AmorceSecurityError
+from .mcp_client import MCPPool, MCPTool
 
-from .mcp_client import MCPClient, MCPTool
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Configure logging. Request threads only enqueue records; formatting and
+# the stream write happen on a listener thread.
+_log_queue_handler = logging.handlers.QueueHandler(queue.Queue(-1))
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
 logger = logging.getLogger(__name__)
 
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_log_listener():
+    """Start draining the log queue (again in each forked worker)."""
+    global _log_listener
+    if _log_listener is not None:
+        # Forked child: records still queued belong to the parent. Under
+        # gevent the parent's listener survives the fork as a greenlet, so
+        # drop those records (no other thread runs here); it then idles.
+        _log_listener.queue.queue.clear()
+        _log_queue_handler.queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue_handler.queue, _log_stream_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+def _stop_log_listener():
+    """Flush queued records at interpreter exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+_start_log_listener()
+os.register_at_fork(after_in_child=_start_log_listener)
+atexit.register(_stop_log_listener)
+
+
+def _ojson(obj: Any, status: int = 200) -> Response:
+    """Serialize obj with orjson into a JSON Response."""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+def _compile_validators(schemas) -> Dict[str, Any]:
+    """
+    Compile each tool's input_schema into a validator function.
+    
+    Args:
+        schemas: Iterable of (tool_name, input_schema) pairs
+        
+    Returns:
+        Mapping of tool name to validator (empty without fastjsonschema)
+    """
+    if fastjsonschema is None:
+        return {}
+    validators = {}
+    for name, schema in schemas:
+        try:
+            validators[name] = fastjsonschema.compile(schema or {})
+        except Exception as e:
+            logger.warning(f"Skipping argument validation for {name}: {e}")
+    return validators
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the wrapper's background event loop, backed by uvloop when
+    available.
+    
+    Under gevent the loop thread is a greenlet, and uvloop's C loop would
+    block the hub, so the stdlib loop (on gevent-patched selectors) is
+    used there.
+    """
+    if uvloop is not None and not _gevent_patched():
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _gevent_patched() -> bool:
+    """True if gevent has monkey-patched threading in this process."""
+    monkey = sys.modules.get("gevent.monkey")
+    return monkey is not None and monkey.is_module_patched("threading")
+
+
+def _hitl_required(tool_name: str) -> Response:
+    """403 response for a HITL tool called without an approval."""
+    return _ojson({
+        "error": "Approval required",
+        "requires_hitl": True,
+        "tool_name": tool_name,
+        "message": f"Tool '{tool_name}' requires human approval before execution"
+    }, 403)
+
+
+def _ndjson_blocks(contents: List[Any]):
+    """Yield resource content blocks as newline-delimited JSON."""
+    for block in contents:
+        yield orjson.dumps(block) + b"\n"
+
 
 class MCPAgentWrapper:
     """
@@ -45,6 +159,15 @@ class MCPAgentWrapper:
     Provides AATP endpoints that translate to MCP protocol calls.
     """
     
+    TOOLS_CACHE_TTL = 60  # seconds
+    # With a shared Redis entry, each worker keeps only a brief local copy
+    # so an invalidation reaches all workers quickly
+    TOOLS_LOCAL_TTL = 2  # seconds
+    
+    # Short-lived LRU of successful AATP verifications (duplicate requests)
+    VERIFY_CACHE_TTL = 5.0  # seconds
+    VERIFY_CACHE_SIZE = 1024
+    
     def __init__(
         self,
         mcp_command: List[str],
@@ -52,7 +175,8 @@ class MCPAgentWrapper:
         require_hitl_for: Optional[List[str]] = None,
         port: int = 5000,
         orchestrator_url: Optional[str] = None,
-        trust_directory_url: Optional[str] = None
+        trust_directory_url: Optional[str] = None,
+        pool_size: Optional[int] = None
     ):
         """
         Initialize MCP agent wrapper.
@@ -62,17 +186,44 @@ class MCPAgentWrapper:
             server_name: Server name for logging
             require_hitl_for: List of tool names requiring HITL approval
             port: Port to run Flask app on
+            pool_size: Number of warm MCP server processes (MCP_POOL_SIZE)
         """
-        self.mcp_client = MCPClient(mcp_command, server_name)
+        self.pool = MCPPool(
+            mcp_command,
+            server_name,
+            size=pool_size or int(os.getenv('MCP_POOL_SIZE', '2'))
+        )
         self.server_name = server_name
         self.require_hitl = require_hitl_for or []
         self.port = port
         self.orchestrator_url = orchestrator_url or os.getenv('ORCHESTRATOR_URL', 'http://localhost:8080')
         self.trust_directory_url = trust_directory_url or os.getenv('TRUST_DIRECTORY_URL')
         self.app = Flask(__name__)
+        # Lets server hooks (e.g. Gunicorn post_worker_init) find the wrapper
+        self.app.extensions["mcp_wrapper"] = self
         self.tools_cache: Optional[List[MCPTool]] = None
+        # Prebuilt /v1/tools/list body, refreshed at most once per TTL
+        self._tools_body: Optional[bytes] = None
+        self._tools_expiry = 0.0
+        self._tools_lock = threading.Lock()
+        # Compiled input_schema validators, rebuilt with the tool list
+        self._validators: Dict[str, Any] = {}
+        self._tools_key = f"mcp:tools:{server_name}"
+        self._redis = self._connect_redis(os.getenv('REDIS_URL'))
+        self._verify_cache: "OrderedDict[bytes, Tuple[Any, float]]" = OrderedDict()
+        self._verify_lock = threading.Lock()
         self.start_time = time.time()
         
+        # One event loop per worker process, run on a background thread and
+        # started on first use (i.e. after Gunicorn forks). MCP subprocess
+        # pipes are bound to this loop; handlers submit coroutines to it.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_pid: Optional[int] = None
+        self._loop_lock = threading.Lock()
+        # Keep-alive client for orchestrator approval lookups, created on
+        # the background loop it is bound to
+        self._http: Optional[httpx.AsyncClient] = None
+        
         # Standalone mode: If no trust directory, use development verification
         # This allows testing without a full trust directory setup
         self.standalone_mode = not self.trust_directory_url
@@ -94,6 +245,7 @@ class MCPAgentWrapper:
         logger.info(f"HITL required for: {self.require_hitl}")
         
         self._setup_routes()
+        atexit.register(self.close)
         
     def _setup_routes(self):
         """Set up Flask routes for AATP endpoints."""
@@ -106,14 +258,13 @@ class MCPAgentWrapper:
             
             # Check MCP server connection
             try:
-                if self.mcp_client.process:
-                    mcp_connected = True
+                mcp_connected = self.pool.connected
             except Exception:
                 mcp_status = "degraded"
             
             uptime = int(time.time() - self.start_time)
             
-            return jsonify({
+            return _ojson({
                 "status": "healthy" if mcp_connected else "degraded",
                 "server": self.server_name,
                 "type": "mcp-wrapper",
@@ -125,10 +276,14 @@ class MCPAgentWrapper:
                 "hitl_tools": self.require_hitl
             })
             
-        def _verify_request_with_standalone():
+        def _verify_request_with_standalone(parsed: Any = None):
             """
             Verifies an AATP request. If in standalone mode, it bypasses
             full signature verification and returns a simple verified object.
+            
+            Args:
+                parsed: Body already decoded by the route, reused as the
+                    standalone payload instead of parsing it again
             """
             if self.standalone_mode:
                 logger.warning("⚠️  Standalone mode: Bypassing full AATP signature verification")
@@ -154,14 +309,12 @@ class MCPAgentWrapper:
                         self.agent_id = agent_id
                         self.payload = payload
                 
-                return StandaloneVerified(agent_id, request.json if request.is_json else {})
+                if parsed is None:
+                    parsed = orjson.loads(request.get_data()) if request.is_json else {}
+                return StandaloneVerified(agent_id, parsed)
             else:
-                # Production mode: full verification
-                return verify_request(
-                    headers=request.headers,
-                    body=request.get_data(),
-                    directory_url=self.trust_directory_url
-                )
+                # Production mode: full verification (cached briefly)
+                return self._verify_cached(request.headers, request.get_data())
 
         @self.app.route('/v1/tools/list', methods=['POST'])
         @self.limiter.limit("20 per minute")
@@ -174,33 +327,32 @@ class MCPAgentWrapper:
                 # Verify request (with standalone mode support)
                 verified = _verify_request_with_standalone()
                 
-                # Get tools from MCP server
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                return Response(self._tools_body_cached(), mimetype="application/json")
                 
-                if not self.tools_cache:
-                    tools = loop.run_until_complete(self._get_tools())
-                    self.tools_cache = tools
-                else:
-                    tools = self.tools_cache
+            except AmorceSecurityError as e:
+                return _ojson({"error": f"Unauthorized: {str(e)}"}, 401)
+            except Exception as e:
+                return _ojson({"error": f"Internal error: {str(e)}"}, 500)
+        
+        @self.app.route('/v1/tools/invalidate', methods=['POST'])
+        @self.limiter.limit("10 per minute")
+        def invalidate_tools():
+            """
+            Drop the cached tool list so the next list call re-queries MCP.
+            Performs AATP signature verification.
+            """
+            try:
+                verified = _verify_request_with_standalone()
                 
-                # Format as AATP response
-                return jsonify({
-                    "tools": [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "input_schema": tool.input_schema,
-                            "requires_approval": tool.name in self.require_hitl
-                        }
-                        for tool in tools
-                    ]
-                })
+                self.invalidate_tools()
+                logger.info(f"Tool cache invalidated by agent {verified.agent_id}")
+                
+                return _ojson({"status": "invalidated"})
                 
             except AmorceSecurityError as e:
-                return jsonify({"error": f"Unauthorized: {str(e)}"}), 401
+                return _ojson({"error": f"Unauthorized: {str(e)}"}, 401)
             except Exception as e:
-                return jsonify({"error": f"Internal error: {str(e)}"}), 500
+                return _ojson({"error": f"Internal error: {str(e)}"}, 500)
                 
         @self.app.route('/v1/tools/call', methods=['POST'])
         @self.limiter.limit("10 per minute")
@@ -216,8 +368,19 @@ class MCPAgentWrapper:
             }
             """
             try:
+                # A HITL tool without approval_id is denied regardless of who
+                # signed the request, so skip signature verification for it
+                try:
+                    parsed = orjson.loads(request.get_data())
+                except ValueError:
+                    parsed = None
+                tool_name = self._peek_hitl_denial(parsed)
+                if tool_name is not None:
+                    logger.info(f"HITL required for {tool_name}, no approval provided")
+                    return _hitl_required(tool_name)
+                
                 # Verify AATP signature
-                verified = _verify_request_with_standalone()
+                verified = _verify_request_with_standalone(parsed)
                 
                 payload = verified.payload.get('payload', {})
                 tool_name = payload.get('tool_name')
@@ -227,45 +390,44 @@ class MCPAgentWrapper:
                 
                 if not tool_name:
                     logger.warning("Tool call missing tool_name")
-                    return jsonify({"error": "Missing tool_name"}), 400
+                    return _ojson({"error": "Missing tool_name"}, 400)
                 
                 logger.info(f"Tool call request: {tool_name} from agent {agent_id}")
                 
+                # Reject malformed arguments before any MCP round-trip
+                validator = self._validators.get(tool_name)
+                if validator is not None:
+                    try:
+                        validator(arguments)
+                    except fastjsonschema.JsonSchemaException as e:
+                        logger.warning(f"Invalid arguments for {tool_name}: {e.message}")
+                        return _ojson({"error": f"Invalid arguments: {e.message}"}, 400)
+                
                 # HITL Check with orchestrator integration
                 if tool_name in self.require_hitl:
                     if not approval_id:
                         # Tool requires approval but none provided
                         logger.info(f"HITL required for {tool_name}, no approval provided")
-                        return jsonify({
-                            "error": "Approval required",
-                            "requires_hitl": True,
-                            "tool_name": tool_name,
-                            "message": f"Tool '{tool_name}' requires human approval before execution"
-                        }), 403
+                        return _hitl_required(tool_name)
                     
                     # Verify approval with orchestrator
                     approval_valid = self._verify_approval(approval_id, tool_name, agent_id)
                     if not approval_valid:
                         logger.warning(f"Invalid approval {approval_id} for tool {tool_name}")
-                        return jsonify({
+                        return _ojson({
                             "error": "Invalid or expired approval",
                             "approval_id": approval_id
-                        }), 403
+                        }, 403)
                     
                     logger.info(f"Approval {approval_id} verified for {tool_name}")
                 
                 # Execute tool via MCP
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                    result = loop.run_until_complete(
-                        self._call_tool(tool_name, arguments)
-                    )
+                    result = self._run(self._call_tool(tool_name, arguments))
                     
                     logger.info(f"Tool {tool_name} executed successfully")
                     
-                    return jsonify({
+                    return _ojson({
                         "status": "success",
                         "tool_name": tool_name,
                         "result": result
@@ -273,18 +435,18 @@ class MCPAgentWrapper:
                 
                 except subprocess.TimeoutExpired:
                     logger.error(f"MCP server timeout for tool {tool_name}")
-                    return jsonify({"error": "MCP server timeout"}), 504
+                    return _ojson({"error": "MCP server timeout"}, 504)
                 except ConnectionError as e:
                     logger.error(f"MCP server connection error: {e}")
-                    return jsonify({"error": "MCP server unavailable"}), 503
+                    return _ojson({"error": "MCP server unavailable"}, 503)
                 except Exception as e:
                     logger.error(f"Tool execution failed for {tool_name}: {e}", exc_info=True)
-                    return jsonify({"error": f"Tool execution failed: {str(e)}"}), 500
+                    return _ojson({"error": f"Tool execution failed: {str(e)}"}, 500)
                 
             except AmorceSecurityError as e:
-                return jsonify({"error": f"Unauthorized: {str(e)}"}), 401
+                return _ojson({"error": f"Unauthorized: {str(e)}"}, 401)
             except Exception as e:
-                return jsonify({"error": f"Tool execution failed: {str(e)}"}), 500
+                return _ojson({"error": f"Tool execution failed: {str(e)}"}, 500)
                 
         @self.app.route('/v1/resources/list', methods=['POST'])
         def list_resources():
@@ -292,14 +454,9 @@ class MCPAgentWrapper:
             try:
                 verified = _verify_request_with_standalone()
                 
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                resources = self._run(self._list_resources())
                 
-                resources = loop.run_until_complete(
-                    self.mcp_client.list_resources()
-                )
-                
-                return jsonify({
+                return _ojson({
                     "resources": [
                         {
                             "uri": res.uri,
@@ -312,13 +469,18 @@ class MCPAgentWrapper:
                 })
                 
             except AmorceSecurityError as e:
-                return jsonify({"error": f"Unauthorized: {str(e)}"}), 401
+                return _ojson({"error": f"Unauthorized: {str(e)}"}, 401)
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _ojson({"error": str(e)}, 500)
                 
         @self.app.route('/v1/resources/read', methods=['POST'])
         def read_resource():
-            """Read an MCP resource."""
+            """
+            Read an MCP resource.
+            
+            Clients sending "Accept: application/x-ndjson" get the content
+            blocks streamed one per line instead of a single JSON document.
+            """
             try:
                 verified = _verify_request_with_standalone()
                 
@@ -326,24 +488,192 @@ class MCPAgentWrapper:
                 uri = payload.get('uri')
              
                 if not uri:
-                    return jsonify({"error": "Missing uri"}), 400
+                    return _ojson({"error": "Missing uri"}, 400)
                 
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                contents = self._run(self._read_resource(uri))
                 
-                contents = loop.run_until_complete(
-                    self.mcp_client.read_resource(uri)
-                )
+                if "application/x-ndjson" in request.headers.get("Accept", ""):
+                    return Response(_ndjson_blocks(contents), mimetype="application/x-ndjson")
                 
-                return jsonify({
+                return _ojson({
                     "uri": uri,
                     "contents": contents
                 })
                 
             except AmorceSecurityError as e:
-                return jsonify({"error": f"Unauthorized: {str(e)}"}), 401
+                return _ojson({"error": f"Unauthorized: {str(e)}"}, 401)
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _ojson({"error": str(e)}, 500)
+    
+    def _peek_hitl_denial(self, parsed: Any) -> Optional[str]:
+        """
+        Return the tool name if the unverified, decoded body asks for a
+        HITL tool without an approval_id, else None.
+        
+        The result only ever leads to a denial, which reveals nothing that
+        /v1/tools/list does not already publish.
+        """
+        if not self.require_hitl or not isinstance(parsed, dict):
+            return None
+        payload = parsed.get('payload')
+        if not isinstance(payload, dict):
+            return None
+        tool_name = payload.get('tool_name')
+        if tool_name in self.require_hitl and not payload.get('approval_id'):
+            return tool_name
+        return None
+    
+    def _verify_cached(self, headers, body: bytes):
+        """
+        Verify an AATP request, reusing a recent result for identical requests.
+        
+        The cache key is a BLAKE2 digest of agent ID, signature and body,
+        which are the inputs verify_request() depends on. Only successful
+        verifications are cached, for VERIFY_CACHE_TTL seconds.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(headers.get('X-Amorce-Agent-ID', '').encode())
+        digest.update(b"\0")
+        digest.update(headers.get('X-Agent-Signature', '').encode())
+        digest.update(b"\0")
+        digest.update(body)
+        key = digest.digest()
+        
+        now = time.monotonic()
+        with self._verify_lock:
+            hit = self._verify_cache.get(key)
+            if hit is not None and now - hit[1] < self.VERIFY_CACHE_TTL:
+                self._verify_cache.move_to_end(key)
+                return hit[0]
+        
+        verified = verify_request(
+            headers=headers,
+            body=body,
+            directory_url=self.trust_directory_url
+        )
+        
+        with self._verify_lock:
+            self._verify_cache[key] = (verified, now)
+            self._verify_cache.move_to_end(key)
+            if len(self._verify_cache) > self.VERIFY_CACHE_SIZE:
+                self._verify_cache.popitem(last=False)
+        return verified
+    
+    def _tools_body_cached(self) -> bytes:
+        """
+        Return the serialized tool list, refreshing it from MCP after the TTL.
+        
+        Concurrent cold requests wait on one refresh instead of each
+        querying the MCP server. When Redis is configured, the body is
+        shared by all workers under one key.
+        """
+        body = self._tools_body
+        if body is not None and time.monotonic() < self._tools_expiry:
+            return body
+        
+        with self._tools_lock:
+            if self._tools_body is None or time.monotonic() >= self._tools_expiry:
+                body = self._redis_get_tools()
+                if body is None:
+                    tools = self._run(self._get_tools())
+                    self.tools_cache = tools
+                    self._validators = _compile_validators(
+                        (tool.name, tool.input_schema) for tool in tools
+                    )
+                    
+                    # Format as AATP response
+                    body = orjson.dumps({
+                        "tools": [
+                            {
+                                "name": tool.name,
+                                "description": tool.description,
+                                "input_schema": tool.input_schema,
+                                "requires_approval": tool.name in self.require_hitl
+                            }
+                            for tool in tools
+                        ]
+                    })
+                    self._redis_set_tools(body)
+                elif body != self._tools_body:
+                    self._validators = _compile_validators(
+                        (tool["name"], tool["input_schema"])
+                        for tool in orjson.loads(body)["tools"]
+                    )
+                
+                self._tools_body = body
+                ttl = self.TOOLS_LOCAL_TTL if self._redis is not None else self.TOOLS_CACHE_TTL
+                self._tools_expiry = time.monotonic() + ttl
+            return self._tools_body
+    
+    def invalidate_tools(self):
+        """Drop the cached tool list, locally and in Redis if configured."""
+        with self._tools_lock:
+            self.tools_cache = None
+            self._validators = {}
+            self._tools_body = None
+            self._tools_expiry = 0.0
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._tools_key)
+            except Exception as e:
+                logger.warning(f"Redis tool cache invalidation failed: {e}")
+    
+    @staticmethod
+    def _connect_redis(redis_url: Optional[str]):
+        """Return a Redis client for the shared tool cache, or None."""
+        if not redis_url:
+            return None
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url, socket_connect_timeout=0.1)
+            client.ping()
+            logger.info("Sharing MCP tool cache via Redis")
+            return client
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using per-process tool cache: {e}")
+            return None
+    
+    def _redis_get_tools(self) -> Optional[bytes]:
+        """Read the shared tool list body, or None on miss/error."""
+        if self._redis is None:
+            return None
+        try:
+            return self._redis.get(self._tools_key)
+        except Exception as e:
+            logger.warning(f"Redis tool cache read failed: {e}")
+            return None
+    
+    def _redis_set_tools(self, body: bytes):
+        """Publish the tool list body for other workers."""
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(self._tools_key, body, ex=self.TOOLS_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Redis tool cache write failed: {e}")
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return this process's background event loop, starting it if needed."""
+        loop = self._loop
+        if loop is not None and self._loop_pid == os.getpid():
+            return loop
+        
+        with self._loop_lock:
+            if self._loop is None or self._loop_pid != os.getpid():
+                loop = _new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="mcp-wrapper-loop",
+                    daemon=True
+                ).start()
+                self._loop = loop
+                self._loop_pid = os.getpid()
+                self._http = None
+            return self._loop
+    
+    def _run(self, coro):
+        """Run a coroutine on the background event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
     
     def _verify_approval(self, approval_id: str, tool_name: str, agent_id: str) -> bool:
         """
@@ -374,10 +704,7 @@ class MCPAgentWrapper:
         
         # PRODUCTION MODE: Call orchestrator API
         try:
-            response = requests.get(
-                f"{self.orchestrator_url}/v1/approvals/{approval_id}",
-                timeout=5
-            )
+            response = self._run(self._fetch_approval(approval_id))
             
             if response.status_code != 200:
                 logger.error(f"Approval verification failed: {response.status_code}")
@@ -401,31 +728,69 @@ class MCPAgentWrapper:
             logger.info(f"✅ Approval verified: {approval_id}")
             return True
             
-        except requests.RequestException as e:
+        except Exception as e:
+            # Transport errors, non-JSON bodies (ValueError) and event-loop
+            # failures all mean the approval could not be confirmed
             logger.error(f"Error verifying approval: {e}")
             return False
+    
+    async def _fetch_approval(self, approval_id: str) -> httpx.Response:
+        """GET an approval from the orchestrator over a pooled connection."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.orchestrator_url,
+                http2=True,
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return await self._http.get(f"/v1/approvals/{approval_id}")
         
     async def _get_tools(self) -> List[MCPTool]:
-        """Connect to MCP server and get tools."""
-        await self.mcp_client.connect()
-        tools = await self.mcp_client.list_tools()
-        return tools
+        """Get tools from a pooled MCP server."""
+        async with self.pool.acquire() as client:
+            return await client.list_tools()
         
     async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Execute tool on MCP server."""
-        # Ensure connected
-        if not self.mcp_client.process:
-            await self.mcp_client.connect()
-            
-        result = await self.mcp_client.call_tool(tool_name, arguments)
-        return result
+        """Execute tool on a pooled MCP server."""
+        async with self.pool.acquire() as client:
+            return await client.call_tool(tool_name, arguments)
+    
+    async def _list_resources(self):
+        """List resources from a pooled MCP server."""
+        async with self.pool.acquire() as client:
+            return await client.list_resources()
+    
+    async def _read_resource(self, uri: str) -> Any:
+        """Read a resource from a pooled MCP server."""
+        async with self.pool.acquire() as client:
+            return await client.read_resource(uri)
+    
+    def warmup(self):
+        """Start the pooled MCP server processes ahead of the first request."""
+        self._run(self.pool.warmup())
+    
+    def close(self):
+        """Stop the pooled MCP server processes and the approval client."""
+        if self._http is not None:
+            try:
+                self._run(self._http.aclose())
+            except Exception as e:
+                logger.error(f"Error closing approval client: {e}")
+            self._http = None
+        if not self.pool.connected:
+            return
+        try:
+            self._run(self.pool.drain())
+        except Exception as e:
+            logger.error(f"Error stopping MCP servers: {e}")
         
     def run(self):
         """Start the Flask wrapper server."""
-        print(f"🚀 MCP Agent Wrapper starting...")
-        print(f"   Server: {self.server_name}")
-        print(f"   Port: {self.port}")
-        print(f"   HITL Required For: {self.require_hitl or 'None'}")
+        logger.info(
+            "🚀 MCP Agent Wrapper starting server=%s port=%d hitl=%s",
+            self.server_name, self.port, self.require_hitl or None
+        )
+        self.warmup()
         
         self.app.run(
             host='0.0.0.0',
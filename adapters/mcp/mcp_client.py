@@ -8,10 +8,21 @@ Supports:
 """
 
 import asyncio
-import json
-import subprocess
-from typing import Dict, List, Any, Optional
+import itertools
+import logging
+import re
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional, AsyncIterator
 from dataclasses import dataclass
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Locate the JSON-RPC id of a response too large to parse: servers put it
+# either first ({"jsonrpc": "2.0", "id": N, ...}) or last ({..., "id": N})
+_HEAD_ID_RE = re.compile(rb'^\s*\{\s*(?:"jsonrpc"\s*:\s*"2\.0"\s*,\s*)?"id"\s*:\s*(\d+)')
+_TAIL_ID_RE = re.compile(rb'"id"\s*:\s*(\d+)\s*\}\s*$')
+_ID_SCAN_BYTES = 4096
 
 
 @dataclass
@@ -36,8 +47,16 @@ class MCPClient:
     Client for communicating with MCP servers.
     
     Supports STDIO transport (most common for MCP servers).
+    
+    Requests are multiplexed over one process: a reader task dispatches each
+    JSON-RPC response to the caller waiting on its id, so any number of
+    calls can be in flight concurrently.
     """
     
+    TERMINATE_TIMEOUT = 2.0  # seconds before SIGTERM escalates to SIGKILL
+    # Largest response line accepted; bigger replies fail just their request
+    MAX_RESPONSE_BYTES = 16 * 2**20
+    
     def __init__(self, command: List[str], server_name: str):
         """
         Initialize MCP client.
@@ -48,19 +67,31 @@ class MCPClient:
         """
         self.command = command
         self.server_name = server_name
-        self.process: Optional[subprocess.Popen] = None
-        self._message_id = 0
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._next_id = itertools.count(1).__next__
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._ready = False
+    
+    @property
+    def connected(self) -> bool:
+        """True once the server process is running and initialized."""
+        return self._ready and self.process is not None and self.process.returncode is None
         
     async def connect(self):
         """Start the MCP server process."""
-        self.process = subprocess.Popen(
-            self.command,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=0
+        self._ready = False
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=None,  # inherit: server crashes and startup errors reach our logs
+            limit=self.MAX_RESPONSE_BYTES  # tool results can be far larger than the 64 KiB default
         )
+        # Bound once per process; used on every request
+        self._write = self.process.stdin.write
+        self._drain = self.process.stdin.drain
+        self._reader_task = asyncio.create_task(self._reader_loop(self.process))
         
         # Send initialize request
         init_response = await self._send_request("initialize", {
@@ -77,14 +108,95 @@ class MCPClient:
         
         # Send initialized notification
         await self._send_notification("notifications/initialized")
+        self._ready = True
         
         return init_response
         
     async def disconnect(self):
         """Stop the MCP server process."""
-        if self.process:
+        self._ready = False
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_pending(ConnectionError(f"MCP server {self.server_name} disconnected"))
+        if self.process and self.process.returncode is None:
             self.process.terminate()
-            self.process.wait(timeout=5)
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=self.TERMINATE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"MCP server {self.server_name} ignored SIGTERM, killing")
+                self.process.kill()
+                await self.process.wait()
+    
+    async def _reader_loop(self, process: asyncio.subprocess.Process):
+        """Dispatch responses from the server's stdout to waiting requests."""
+        stdout = process.stdout
+        try:
+            while True:
+                try:
+                    line = await stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial
+                except asyncio.LimitOverrunError as e:
+                    await self._discard_oversized(stdout, e.consumed)
+                    continue
+                if not line:
+                    break
+                try:
+                    message = orjson.loads(line)
+                except ValueError:
+                    logger.warning(f"Ignoring non-JSON output from MCP server {self.server_name}")
+                    continue
+                
+                # Server-initiated requests/notifications carry no pending id
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        finally:
+            self._ready = False
+            self._fail_pending(ConnectionError(f"MCP server {self.server_name} closed its stdout"))
+    
+    async def _discard_oversized(self, stdout: asyncio.StreamReader, consumed: int):
+        """
+        Skip a response line longer than MAX_RESPONSE_BYTES and fail the
+        request it answers, keeping the reader (and the server) alive.
+        
+        Args:
+            stdout: Server output stream, positioned at the oversized line
+            consumed: Bytes readuntil() reported as safe to consume
+        """
+        chunk = await stdout.readexactly(consumed)
+        head, tail, size = chunk[:_ID_SCAN_BYTES], chunk[-_ID_SCAN_BYTES:], len(chunk)
+        while True:
+            try:
+                chunk = await stdout.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                chunk = e.partial
+            except asyncio.LimitOverrunError as e:
+                chunk = await stdout.readexactly(e.consumed)
+                tail, size = (tail + chunk)[-_ID_SCAN_BYTES:], size + len(chunk)
+                continue
+            tail, size = (tail + chunk)[-_ID_SCAN_BYTES:], size + len(chunk)
+            break
+        
+        match = _HEAD_ID_RE.match(head) or _TAIL_ID_RE.search(tail)
+        message_id = int(match.group(1)) if match else None
+        logger.error(
+            f"Discarded {size}-byte response (id={message_id}) from MCP server "
+            f"{self.server_name}: exceeds {self.MAX_RESPONSE_BYTES} bytes"
+        )
+        future = self._pending.pop(message_id, None)
+        if future is not None and not future.done():
+            future.set_exception(ValueError(
+                f"MCP response too large: {size} bytes exceeds {self.MAX_RESPONSE_BYTES}"
+            ))
+    
+    def _fail_pending(self, exc: BaseException):
+        """Fail every request still waiting for a response."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
             
     async def list_tools(self) -> List[MCPTool]:
         """
@@ -176,22 +288,24 @@ class MCPClient:
         Returns:
             Response data
         """
-        self._message_id += 1
+        message_id = self._next_id()
         message = {
             "jsonrpc": "2.0",
-            "id": self._message_id,
+            "id": message_id,
             "method": method,
             "params": params
         }
         
-        # Write request
-        request_str = json.dumps(message) + "\n"
-        self.process.stdin.write(request_str)
-        self.process.stdin.flush()
-        
-        # Read response
-        response_str = self.process.stdout.readline()
-        response = json.loads(response_str)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            # Write request; the reader task resolves the future
+            self._write(orjson.dumps(message) + b"\n")
+            await self._drain()
+            
+            response = await future
+        finally:
+            self._pending.pop(message_id, None)
         
         if "error" in response:
             raise Exception(f"MCP Error: {response['error']}")
@@ -212,15 +326,76 @@ class MCPClient:
             "params": params or {}
         }
         
-        notification_str = json.dumps(message) + "\n"
-        self.process.stdin.write(notification_str)
-        self.process.stdin.flush()
+        self._write(orjson.dumps(message) + b"\n")
+        await self._drain()
         
-    def __enter__(self):
-        """Context manager entry."""
-        asyncio.run(self.connect())
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
         return self
         
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        asyncio.run(self.disconnect())
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+
+
+class MCPPool:
+    """
+    Fixed-size pool of warm MCP server processes.
+    
+    Tool calls are spread round-robin over already-initialized servers
+    instead of paying the spawn + initialize handshake on the request path.
+    Each client multiplexes concurrent calls, so checkout is not exclusive.
+    A client whose process has exited is reconnected on checkout. Must be
+    used from a single event loop.
+    """
+    
+    def __init__(self, command: List[str], server_name: str, size: int = 2):
+        """
+        Initialize the pool (no processes are started here).
+        
+        Args:
+            command: Command to start MCP server
+            server_name: Friendly name for logging
+            size: Number of MCP server processes
+        """
+        self.server_name = server_name
+        self.size = size
+        self.clients = [MCPClient(command, server_name) for _ in range(size)]
+        self._next = itertools.cycle(self.clients)
+        self._connect_lock = asyncio.Lock()
+    
+    @staticmethod
+    def _alive(client: MCPClient) -> bool:
+        return client.connected
+    
+    @property
+    def connected(self) -> bool:
+        """True if at least one MCP server process is running."""
+        return any(self._alive(client) for client in self.clients)
+    
+    async def warmup(self):
+        """Start and initialize every MCP server process in the pool."""
+        for client in self.clients:
+            if not self._alive(client):
+                await client.connect()
+        logger.info(f"MCP pool for {self.server_name} warmed up ({self.size} processes)")
+    
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[MCPClient]:
+        """Pick the next connected client (round-robin) for the block."""
+        client = next(self._next)
+        if not self._alive(client):
+            async with self._connect_lock:
+                if not self._alive(client):
+                    if client.process is not None:
+                        logger.warning(f"MCP server {self.server_name} exited, respawning")
+                        await client.disconnect()
+                    await client.connect()
+        yield client
+    
+    async def drain(self):
+        """Stop every MCP server process in the pool, concurrently."""
+        await asyncio.gather(*(
+            client.disconnect() for client in self.clients if client.process is not None
+        ))
@@ -174,7 +174,7 @@ class IRateLimiter(ABC):
     """
     
     @abstractmethod
-    def check_limit(self, agent_id: str, limit: int = 10, window: int = 60) -> bool:
+    def check_limit(self, agent_id: str, limit: int = 10, window: int = 60) -> tuple[bool, int]:
         """
         Check if an agent is within rate limits.
         
@@ -184,10 +184,9 @@ class IRateLimiter(ABC):
             window: Time window in seconds
             
         Returns:
-            True if within limits, False if exceeded.
-            
-        Raises:
-            Exception if limit exceeded (for fail-fast behavior)
+            (allowed, retry_after): allowed is False if the limit is
+            exceeded, retry_after is the number of seconds until the
+            agent may retry (0 when allowed).
         """
         pass
 
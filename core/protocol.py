@@ -32,6 +32,7 @@ class AmorceProtocol:
     ERROR_NOT_FOUND = "NOT_FOUND"
     ERROR_RATE_LIMIT = "RATE_LIMIT_EXCEEDED"
     ERROR_INTERNAL = "INTERNAL_ERROR"
+    ERROR_SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
     ERROR_INVALID_SIGNATURE = "INVALID_SIGNATURE"
     
     @staticmethod
@@ -95,7 +96,8 @@ class AmorceProtocol:
         return response
     
     @staticmethod
-    def create_success_response(transaction_id: str, result: Any, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+    def create_success_response(transaction_id: str, result: Any, metadata: Optional[Dict] = None,
+                                timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a standardized success response.
         
@@ -103,6 +105,7 @@ class AmorceProtocol:
             transaction_id: The transaction identifier
             result: The result data from the provider
             metadata: Optional metadata
+            timestamp: ISO-8601 timestamp to reuse (defaults to now)
             
         Returns:
             Success response dictionary
@@ -110,7 +113,7 @@ class AmorceProtocol:
         response = {
             "transaction_id": transaction_id,
             "status": "success",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
             "result": result
         }
         
@@ -138,6 +141,7 @@ class AmorceProtocol:
             AmorceProtocol.ERROR_RATE_LIMIT: 429,
             AmorceProtocol.ERROR_INVALID_SIGNATURE: 403,
             AmorceProtocol.ERROR_INTERNAL: 500,
+            AmorceProtocol.ERROR_SERVICE_UNAVAILABLE: 503,
         }
         return mapping.get(error_code, 500)
 
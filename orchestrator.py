@@ -9,14 +9,21 @@ Supports two modes:
 Set via AMORCE_MODE environment variable (defaults to standalone).
 """
 
+import atexit
 import os
 import logging
+import signal
+import sys
+import orjson
 import requests
 from datetime import datetime, timezone
 from functools import wraps
 from typing import Callable
 
 from flask import Flask, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- AMORCE SDK ---
 from amorce import IdentityManager
@@ -24,6 +31,7 @@ from amorce import IdentityManager
 # --- CORE ---
 from core.interfaces import IAgentRegistry, IStorage, IRateLimiter
 from core.protocol import AmorceProtocol, MessageValidator
+from adapters.local.noop_limiter import NOOP_LIMITER
 
 # --- HITL Approval Routes ---
 from api.approval_routes import approval_bp, init_approval_routes
@@ -32,7 +40,31 @@ from api.approval_routes import approval_bp, init_approval_routes
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    jsonify() responses and request bodies go through orjson; values it
+    cannot encode natively (datetimes included, to keep Flask's format)
+    fall back to DefaultJSONProvider.default.
+    """
+    
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._OPTIONS),
+            mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
+app.json = _OrjsonProvider(app)
 
 # --- MODE SELECTION ---
 AMORCE_MODE = os.environ.get("AMORCE_MODE", "standalone")
@@ -78,26 +110,45 @@ if AMORCE_MODE == "cloud":
         logger.info("✅ Redis rate limiter enabled")
     except Exception as e:
         logger.warning(f"⚠️ Redis unavailable: {e}")
-        from adapters.local.noop_limiter import NoOpRateLimiter
-        limiter = NoOpRateLimiter()
+        limiter = NOOP_LIMITER
 
 else:
     # Standalone Mode: Local files, no cloud dependencies
     from adapters.local.file_registry import LocalFileRegistry
     from adapters.local.sqlite_storage import LocalSQLiteStorage
-    from adapters.local.noop_limiter import NoOpRateLimiter
     
     registry = LocalFileRegistry()
     storage = LocalSQLiteStorage()
-    limiter = NoOpRateLimiter()
+    limiter = NOOP_LIMITER
     
     logger.info("✅ Standalone mode: Using local files")
 
+# Ledger writes are queued for a background flusher; drain them on exit
+atexit.register(storage.close)
+
+# Resolved once: lets the request path skip the no-op limiter call
+RATE_LIMITING_DISABLED = limiter is NOOP_LIMITER
+if RATE_LIMITING_DISABLED:
+    logger.info("Rate limiting disabled (NoOpRateLimiter)")
+
 # --- Initialize HITL Approval Routes ---
 init_approval_routes(storage)
 app.register_blueprint(approval_bp)
 logger.info("✅ HITL approval routes registered")
 
+# --- PROVIDER HTTP ---
+# Pooled session: reuses TCP/TLS connections to provider endpoints.
+# Only connection errors are retried; provider POSTs are not idempotent,
+# so 5xx responses are returned to the caller as-is.
+provider_session = requests.Session()
+_provider_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+provider_session.mount("https://", _provider_adapter)
+provider_session.mount("http://", _provider_adapter)
+
 # --- L1 AUTHENTICATION ---
 AGENT_API_KEY = os.environ.get("AGENT_API_KEY")
 
@@ -160,14 +211,24 @@ def a2a_transact():
         
         sig = request.headers.get('X-Agent-Signature')
         
-        # 3. RATE LIMITING
-        try:
-            limiter.check_limit(consumer_id)
-        except Exception as e:
-            return jsonify(AmorceProtocol.create_error_response(
-                AmorceProtocol.ERROR_RATE_LIMIT,
-                str(e)
-            )), 429
+        # 3. RATE LIMITING (skipped entirely when limiting is disabled)
+        if not RATE_LIMITING_DISABLED:
+            try:
+                allowed, retry_after = limiter.check_limit(consumer_id)
+            except Exception as e:
+                # Over-limit comes back as allowed=False; an exception means
+                # the limiter backend itself failed (e.g. Redis down, fail-closed)
+                logger.error(f"Rate limiter unavailable: {e}")
+                return jsonify(AmorceProtocol.create_error_response(
+                    AmorceProtocol.ERROR_SERVICE_UNAVAILABLE,
+                    "Rate limiting service unavailable"
+                )), 503
+            
+            if not allowed:
+                return jsonify(AmorceProtocol.create_error_response(
+                    AmorceProtocol.ERROR_RATE_LIMIT,
+                    "Rate limit exceeded"
+                )), 429, {"Retry-After": str(retry_after)}
         
         # 4. AGENT LOOKUP (via injected registry)
         consumer_agent = registry.find_agent(consumer_id)
@@ -228,7 +289,7 @@ def a2a_transact():
         logger.info(f"Routing to Provider: {endpoint}{path}")
         
         try:
-            ext_resp = requests.post(
+            ext_resp = provider_session.post(
                 f"{endpoint}{path}",
                 json={"data": body.get("payload", {})},
                 timeout=10
@@ -241,22 +302,29 @@ def a2a_transact():
             )), 500
         
         # 7. METERING (via injected storage)
-        transaction_id = body.get("transaction_id", f"tx_{datetime.now(timezone.utc).timestamp()}")
+        # One clock read and one provider-body parse, shared by the ledger
+        # entry and the response
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
+        transaction_id = body.get("transaction_id")
+        if transaction_id is None:
+            transaction_id = f"tx_{now.timestamp()}"
+        result = ext_resp.json() if ext_resp.status_code == 200 else {"error": ext_resp.text}
         tx_data = {
             "transaction_id": transaction_id,
             "consumer_agent_id": consumer_id,
             "service_id": srv_id,
             "status": "success" if ext_resp.status_code == 200 else "failed",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "result": ext_resp.json() if ext_resp.status_code == 200 else {"error": ext_resp.text}
+            "timestamp": timestamp,
+            "result": result
         }
         storage.log_transaction(tx_data)
         
         # 8. RESPONSE
-        result = ext_resp.json() if ext_resp.status_code == 200 else {"error": ext_resp.text}
         return jsonify(AmorceProtocol.create_success_response(
             transaction_id=transaction_id,
-            result=result
+            result=result,
+            timestamp=timestamp
         )), ext_resp.status_code
         
     except Exception as e:
@@ -305,4 +373,6 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     logger.info(f"🚀 Amorce Orchestrator starting on port {port}")
     logger.info(f"📍 Mode: {AMORCE_MODE}")
+    # SIGTERM (container stop, instance recycle) exits normally so atexit runs
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     app.run(debug=False, host='0.0.0.0', port=port)
\ No newline at end of file
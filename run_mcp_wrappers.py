@@ -11,9 +11,11 @@ Usage:
 
 import argparse
 import json
+import runpy
 import sys
 import os
-from adapters.mcp.mcp_agent_wrapper import MCPAgentWrapper
+
+GUNICORN_CONF = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'adapters', 'mcp', 'gunicorn.conf.py')
 
 
 def load_mcp_config():
@@ -23,6 +25,16 @@ def load_mcp_config():
         return json.load(f)
 
 
+def load_gunicorn_config(path=GUNICORN_CONF):
+    """
+    Execute the Gunicorn config file and return its module namespace.
+    
+    Must run before the wrapper is imported: with the gevent worker the
+    config calls monkey.patch_all(), which has to precede the app import.
+    """
+    return runpy.run_path(path)
+
+
 def list_servers(config):
     """List available MCP servers."""
     print("\n📋 Available MCP Servers:\n")
@@ -49,6 +61,12 @@ def start_server(server_config):
     print(f"   Port: {port}")
     print(f"   HITL Tools: {require_hitl or 'None'}\n")
     
+    # Check if running in production mode
+    env_mode = os.getenv('AMORCE_ENV', 'development')
+    gunicorn_config = load_gunicorn_config() if env_mode == 'production' else None
+    
+    from adapters.mcp.mcp_agent_wrapper import MCPAgentWrapper
+    
     wrapper = MCPAgentWrapper(
         mcp_command=command,
         server_name=name,
@@ -56,9 +74,6 @@ def start_server(server_config):
         port=port
     )
     
-    # Check if running in production mode
-    env_mode = os.getenv('AMORCE_ENV', 'development')
-    
     if env_mode == 'production':
         print("🏭 Running in PRODUCTION mode with Gunicorn")
         # Use Gunicorn for production
@@ -78,12 +93,9 @@ def start_server(server_config):
             def load(self):
                 return self.application
         
-        options = {
-            'bind': f'0.0.0.0:{port}',
-            'workers': 4,
-            'timeout': 120,
-            'loglevel': 'info',
-        }
+        # Every setting and server hook from gunicorn.conf.py; the port
+        # comes from the server entry
+        options = {**gunicorn_config, 'bind': f'0.0.0.0:{port}'}
         StandaloneApplication(wrapper.app, options).run()
     else:
         print("🔧 Running in DEVELOPMENT mode (Flask dev server)")
@@ -43,7 +43,11 @@ def setup_environment():
         "metadata": {"name": "Mock Supplier Agent (Final)"}
     }
 
-    reg_resp = requests.post(
+    # One session for both Directory calls: the service publish reuses the
+    # TLS connection opened by the agent registration
+    http = requests.Session()
+
+    reg_resp = http.post(
         f"{DIRECTORY_URL}/api/v1/agents",
         json=reg_payload,
         headers={"X-Admin-Key": ADMIN_KEY}
@@ -75,7 +79,7 @@ def setup_environment():
     signature = identity.sign_data(canonical_bytes)
 
     print(f"🚀 Publication du service {service_uuid}...")
-    srv_resp = requests.post(
+    srv_resp = http.post(
         f"{DIRECTORY_URL}/api/v1/services",
         data=canonical_bytes,
         headers={
@@ -11,6 +11,7 @@
 import os
 import json
 import logging
+from functools import lru_cache
 import google.generativeai as genai
 from typing import Dict, Any, Optional
 
@@ -27,7 +28,7 @@ SECRET_NAME = os.environ.get("SECRET_NAME", "atp-agent-private-key")
 AGENT_ID = os.environ.get("AGENT_ID", "e4b0c7c8-4b9f-4b0d-8c1a-2b9d1c9a0c1a")
 AGENT_API_KEY = os.environ.get("AGENT_API_KEY")
 
-logger.info(f"DEBUG: Client loaded AGENT_API_KEY (First 8 chars): {AGENT_API_KEY[:8] if AGENT_API_KEY else 'NONE/EMPTY'}")
+logger.debug("Client loaded AGENT_API_KEY (First 8 chars): %s", AGENT_API_KEY[:8] if AGENT_API_KEY else 'NONE/EMPTY')
 
 # Network Configuration
 TRUST_DIRECTORY_URL = os.environ.get("TRUST_DIRECTORY_URL")
@@ -53,7 +54,7 @@ def get_nexus_client() -> AmorceClient:
 
     # --- 1. LOAD IDENTITY (Partie qui manquait) ---
     if not _identity_manager:
-        logger.info(f"🔐 Loading identity from Secret Manager: {SECRET_NAME}...")
+        logger.info("🔐 Loading identity from Secret Manager: %s...", SECRET_NAME)
         try:
             provider = GoogleSecretManagerProvider(
                 project_id=GCP_PROJECT_ID,
@@ -61,7 +62,7 @@ def get_nexus_client() -> AmorceClient:
             )
             _identity_manager = IdentityManager(provider)
         except Exception as e:
-            logger.critical(f"Failed to load identity: {e}")
+            logger.critical("Failed to load identity: %s", e)
             raise
     # ----------------------------------------------
 
@@ -77,6 +78,16 @@ def get_nexus_client() -> AmorceClient:
     return _nexus_client
 
 
+@lru_cache(maxsize=1)
+def get_gemini_model(api_key: str) -> genai.GenerativeModel:
+    """
+    Configures Gemini and returns a process-wide GenerativeModel.
+    genai.configure() mutates global state, so it runs once per key.
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+
 # --- BRIDGE FUNCTIONALITY (Called by Orchestrator) ---
 
 def run_bridge_transaction(service_id: str, payload: dict) -> dict:
@@ -91,7 +102,7 @@ def run_bridge_transaction(service_id: str, payload: dict) -> dict:
     Returns:
         The full transaction result from the provider.
     """
-    logger.info(f"🌉 BRIDGE: Processing request for service {service_id}")
+    logger.info("🌉 BRIDGE: Processing request for service %s", service_id)
 
     try:
         client = get_nexus_client()
@@ -110,7 +121,7 @@ def run_bridge_transaction(service_id: str, payload: dict) -> dict:
             return {"status": "failed", "error": "Transaction returned no response."}
 
     except Exception as e:
-        logger.error(f"Bridge Transaction Failed: {e}")
+        logger.error("Bridge Transaction Failed: %s", e)
         return {"status": "failed", "error": str(e)}
 
 
@@ -136,11 +147,10 @@ def run_agent_loop():
         return
 
     target_service = services[0]
-    logger.info(f"🎯 Target Service Found: {target_service.get('metadata', {}).get('name')}")
+    logger.info("🎯 Target Service Found: %s", target_service.get('metadata', {}).get('name'))
 
     # 2. Initialize Gemini
-    genai.configure(api_key=GOOGLE_API_KEY)
-    model = genai.GenerativeModel('gemini-1.5-flash')
+    model = get_gemini_model(GOOGLE_API_KEY)
 
     chat = model.start_chat(history=[
         {"role": "user", "parts": "You are a buyer agent. You want a flight to Paris. Budget: 600 EUR."}
@@ -162,7 +172,8 @@ def run_agent_loop():
     logger.info("🚀 Sending secure transaction...")
     result = client.transact(target_service, user_intent)
 
-    logger.info(f"✅ Transaction Result: {json.dumps(result, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ Transaction Result: %s", json.dumps(result, separators=(',', ':')))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+"""
+Unit tests for the async Trust Directory registry
+
+Tests cover:
+- Single-flight coalescing of concurrent cache misses
+- Followers surviving cancellation of the leader lookup
+- Bounded TTL caches
+- Rejection of malformed ids before any lookup
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+from adapters.cloud.async_directory_registry import AsyncCloudDirectoryRegistry
+
+AGENT = {"agent_id": "agent-001", "status": "active", "public_key": "pk"}
+
+
+class _Directory:
+    """Mock Trust Directory transport counting upstream lookups."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+    
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await self.release.wait()
+        return httpx.Response(200, json=AGENT)
+
+
+def _registry(directory: _Directory) -> AsyncCloudDirectoryRegistry:
+    """Registry whose HTTP client talks to the mock directory."""
+    registry = AsyncCloudDirectoryRegistry("http://directory.test")
+    registry._client = httpx.AsyncClient(
+        base_url=registry.directory_url,
+        transport=httpx.MockTransport(directory.handler)
+    )
+    return registry
+
+
+class TestAsyncDirectoryRegistry:
+    """Test suite for AsyncCloudDirectoryRegistry."""
+    
+    def test_caches_are_bounded(self):
+        """Test that agent and service caches are size- and TTL-bounded."""
+        registry = AsyncCloudDirectoryRegistry("http://directory.test")
+        assert isinstance(registry._agent_cache, TTLCache)
+        assert isinstance(registry._service_cache, TTLCache)
+        assert registry._agent_cache.maxsize == registry.CACHE_MAXSIZE
+    
+    def test_concurrent_misses_coalesce(self):
+        """Test that N concurrent misses for one agent cause one upstream GET."""
+        async def scenario():
+            directory = _Directory()
+            registry = _registry(directory)
+            tasks = [asyncio.create_task(registry.find_agent("agent-001")) for _ in range(20)]
+            await asyncio.sleep(0.01)
+            directory.release.set()
+            results = await asyncio.gather(*tasks)
+            
+            # Later lookups are served from the cache
+            assert await registry.find_agent("agent-001") == AGENT
+            await registry.aclose()
+            return directory.calls, results
+        
+        calls, results = asyncio.run(scenario())
+        assert calls == 1
+        assert results == [AGENT] * 20
+    
+    def test_leader_cancellation_does_not_cancel_followers(self):
+        """Test that followers retry the lookup when the leader is cancelled."""
+        async def scenario():
+            directory = _Directory()
+            registry = _registry(directory)
+            leader = asyncio.create_task(registry.find_agent("agent-001"))
+            await asyncio.sleep(0.01)
+            followers = [asyncio.create_task(registry.find_agent("agent-001")) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            
+            # Let one follower take over as leader before the directory answers
+            await asyncio.sleep(0.01)
+            directory.release.set()
+            results = await asyncio.gather(*followers)
+            assert registry._inflight == {}
+            await registry.aclose()
+            return directory.calls, results
+        
+        calls, results = asyncio.run(scenario())
+        # The cancelled leader's GET, then exactly one retry for all followers
+        assert calls == 2
+        assert results == [AGENT] * 5
+    
+    def test_cancelled_follower_leaves_leader_running(self):
+        """Test that cancelling a follower does not cancel the shared lookup."""
+        async def scenario():
+            directory = _Directory()
+            registry = _registry(directory)
+            leader = asyncio.create_task(registry.find_agent("agent-001"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(registry.find_agent("agent-001"))
+            await asyncio.sleep(0.01)
+            
+            follower.cancel()
+            directory.release.set()
+            result = await leader
+            await registry.aclose()
+            return directory.calls, result, follower.cancelled()
+        
+        calls, result, follower_cancelled = asyncio.run(scenario())
+        assert calls == 1
+        assert result == AGENT
+        assert follower_cancelled
+    
+    def test_trailing_newline_id_rejected(self):
+        """Test that an id with a trailing newline never reaches the directory."""
+        async def scenario():
+            directory = _Directory()
+            directory.release.set()
+            registry = _registry(directory)
+            results = (await registry.find_agent("abc\n"), await registry.find_service("abc\n"))
+            await registry.aclose()
+            return directory.calls, results
+        
+        calls, results = asyncio.run(scenario())
+        assert calls == 0
+        assert results == (None, None)
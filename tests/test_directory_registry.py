@@ -0,0 +1,104 @@
+"""
+Unit tests for the Trust Directory registry
+
+Tests cover:
+- Single-flight coalescing of concurrent cache misses across threads
+- Leader errors propagating to waiting followers
+- Rejection of malformed ids before any lookup
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import orjson
+import pytest
+
+from adapters.cloud.directory_registry import CloudDirectoryRegistry
+
+AGENT = {"agent_id": "agent-001", "status": "active", "public_key": "pk"}
+N_THREADS = 16
+
+
+def _lookup_all(registry, release):
+    """Run N concurrent find_agent calls; release the leader once all are waiting."""
+    barrier = threading.Barrier(N_THREADS + 1)
+    
+    def lookup():
+        barrier.wait(timeout=5)
+        try:
+            return registry.find_agent("agent-001")
+        except Exception as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=N_THREADS) as ex:
+        futures = [ex.submit(lookup) for _ in range(N_THREADS)]
+        barrier.wait(timeout=5)
+        # Give every thread time to reach the cache miss before answering
+        threading.Event().wait(0.2)
+        release.set()
+        return [f.result(timeout=5) for f in futures]
+
+
+class TestDirectoryRegistrySingleFlight:
+    """Test the in-flight lookup coalescing in CloudDirectoryRegistry."""
+    
+    @pytest.fixture
+    def registry(self):
+        registry = CloudDirectoryRegistry("http://directory.test")
+        yield registry
+        registry.close()
+    
+    def test_concurrent_misses_issue_one_get(self, registry):
+        """Test that N concurrent cache misses cause exactly one upstream GET."""
+        release = threading.Event()
+        
+        def slow_get(url, headers=None, timeout=None):
+            release.wait(timeout=5)
+            return Mock(status_code=200, content=orjson.dumps(AGENT), headers={})
+        
+        registry.session.get = Mock(side_effect=slow_get)
+        
+        results = _lookup_all(registry, release)
+        
+        assert registry.session.get.call_count == 1
+        assert results == [AGENT] * N_THREADS
+        assert registry._inflight == {}
+    
+    def test_leader_error_reaches_followers(self, registry):
+        """Test that an exception in the leader is raised in every follower."""
+        release = threading.Event()
+        
+        def failing_fetch(agent_id):
+            release.wait(timeout=5)
+            raise RuntimeError("directory down")
+        
+        registry._fetch_agent = Mock(side_effect=failing_fetch)
+        
+        results = _lookup_all(registry, release)
+        
+        assert registry._fetch_agent.call_count == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert registry._inflight == {}
+        
+        # The failed lookup is not left in flight: the next call retries
+        registry._fetch_agent = Mock(return_value=AGENT)
+        assert registry.find_agent("agent-001") == AGENT
+
+
+class TestDirectoryRegistryIdValidation:
+    """Test that malformed ids never reach the Trust Directory."""
+    
+    @pytest.fixture
+    def registry(self):
+        registry = CloudDirectoryRegistry("http://directory.test")
+        registry.session.get = Mock(side_effect=AssertionError("unexpected lookup"))
+        yield registry
+        registry.close()
+    
+    @pytest.mark.parametrize("bad_id", ["abc\n", "abc\r", "", "a/b", "a" * 129])
+    def test_malformed_ids_rejected(self, registry, bad_id):
+        """Test that find_agent/find_service reject ids outside the allowed pattern."""
+        assert registry.find_agent(bad_id) is None
+        assert registry.find_service(bad_id) is None
+        registry.session.get.assert_not_called()
@@ -0,0 +1,100 @@
+"""
+Unit tests for Firestore transaction storage
+
+Tests cover:
+- Queued transaction logging through the background flusher
+- Draining the queue on close()
+- flush() waiting only for rows queued before it
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from adapters.cloud.firestore_storage import FirestoreStorage
+
+
+class TestFirestoreStorage:
+    """Test suite for FirestoreStorage with a mocked Firestore client."""
+    
+    @pytest.fixture
+    def client(self):
+        """Mocked firestore.Client patched into the storage module."""
+        with patch('adapters.cloud.firestore_storage.firestore.Client') as client_cls:
+            yield client_cls.return_value
+    
+    @pytest.fixture
+    def storage(self, client):
+        """FirestoreStorage backed by the mocked client."""
+        storage = FirestoreStorage("test-project")
+        yield storage
+        storage.close()
+    
+    def test_close_writes_queued_transactions(self, client, storage):
+        """Test that close() drains every queued row to the BulkWriter."""
+        writer = client.bulk_writer.return_value
+        
+        for i in range(5):
+            storage.log_transaction({"transaction_id": f"tx-{i}", "status": "success"})
+        storage.close()
+        
+        written = [c.args[0] for c in client.collection.return_value.document.call_args_list]
+        assert written == [f"tx-{i}" for i in range(5)]
+        assert writer.set.call_count == 5
+        writer.flush.assert_called()
+        writer.close.assert_called_once()
+    
+    def test_close_is_idempotent(self, client, storage):
+        """Test that a second close() is a no-op."""
+        storage.log_transaction({"transaction_id": "tx-1"})
+        storage.close()
+        storage.close()
+        
+        client.bulk_writer.return_value.close.assert_called_once()
+    
+    def test_log_after_close_writes_synchronously(self, client, storage):
+        """Test that transactions logged after close() are still written."""
+        storage.close()
+        storage.log_transaction({"transaction_id": "tx-late"})
+        
+        client.collection.return_value.document.assert_called_with("tx-late")
+        client.collection.return_value.document.return_value.set.assert_called_once()
+    
+    def test_missing_transaction_id_is_dropped(self, client, storage):
+        """Test that rows without a transaction_id are never enqueued."""
+        storage.log_transaction({"status": "success"})
+        storage.close()
+        
+        client.bulk_writer.return_value.set.assert_not_called()
+    
+    def test_flush_writes_prior_transactions(self, client, storage):
+        """Test that flush() returns once earlier rows reach the BulkWriter."""
+        for i in range(3):
+            storage.log_transaction({"transaction_id": f"tx-{i}"})
+        storage.flush()
+        
+        assert client.bulk_writer.return_value.set.call_count == 3
+    
+    def test_read_not_starved_by_concurrent_writers(self, client, storage):
+        """Test that get_transaction() completes while other threads keep writing."""
+        stop = threading.Event()
+        
+        def writer(offset):
+            i = offset
+            while not stop.is_set():
+                storage.log_transaction({"transaction_id": f"tx-{i}"})
+                i += 4
+        
+        with ThreadPoolExecutor(max_workers=5) as ex:
+            writers = [ex.submit(writer, offset) for offset in range(4)]
+            try:
+                reader = ex.submit(storage.get_transaction, "tx-0")
+                result = reader.result(timeout=5)
+            finally:
+                stop.set()
+            for w in writers:
+                w.result(timeout=5)
+        
+        assert result is not None
@@ -11,7 +11,7 @@ Tests cover:
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from flask import Flask
 import sys
 import os
@@ -69,8 +69,8 @@ class TestMCPAgentWrapper:
         assert data['type'] == 'mcp-wrapper'
     
     @patch('adapters.mcp.mcp_agent_wrapper.verify_request')
-    @patch('adapters.mcp.mcp_agent_wrapper.asyncio.new_event_loop')
-    def test_tools_list_success(self, mock_loop, mock_verify, client, wrapper):
+    @patch('adapters.mcp.mcp_agent_wrapper.MCPAgentWrapper._run')
+    def test_tools_list_success(self, mock_run, mock_verify, client, wrapper):
         """Test successful tool listing."""
         # Mock verification
         mock_verified = Mock()
@@ -79,8 +79,6 @@ class TestMCPAgentWrapper:
         mock_verify.return_value = mock_verified
         
         # Mock async execution
-        mock_event_loop = Mock()
-        mock_loop.return_value = mock_event_loop
         
         # Mock tools
         mock_tools = [
@@ -95,7 +93,7 @@ class TestMCPAgentWrapper:
                 input_schema={"type": "object"}
             )
         ]
-        mock_event_loop.run_until_complete.return_value = mock_tools
+        mock_run.return_value = mock_tools
         
         response = client.post('/v1/tools/list', json={'payload': {}})
         assert response.status_code == 200
@@ -120,8 +118,8 @@ class TestMCPAgentWrapper:
         assert 'Unauthorized' in data['error']
     
     @patch('adapters.mcp.mcp_agent_wrapper.verify_request')
-    @patch('adapters.mcp.mcp_agent_wrapper.asyncio.new_event_loop')
-    def test_tool_call_success(self, mock_loop, mock_verify, client, wrapper):
+    @patch('adapters.mcp.mcp_agent_wrapper.MCPAgentWrapper._run')
+    def test_tool_call_success(self, mock_run, mock_verify, client, wrapper):
         """Test successful tool execution (no HITL required)."""
         # Mock verification
         mock_verified = Mock()
@@ -135,9 +133,7 @@ class TestMCPAgentWrapper:
         mock_verify.return_value = mock_verified
         
         # Mock async execution
-        mock_event_loop = Mock()
-        mock_loop.return_value = mock_event_loop
-        mock_event_loop.run_until_complete.return_value = {"content": "test data"}
+        mock_run.return_value = {"content": "test data"}
         
         response = client.post('/v1/tools/call', json={
             'payload': {
@@ -193,9 +189,8 @@ class TestMCPAgentWrapper:
         assert data['tool_name'] == 'write_file'
     
     @patch('adapters.mcp.mcp_agent_wrapper.verify_request')
-    @patch('adapters.mcp.mcp_agent_wrapper.requests.get')
-    @patch('adapters.mcp.mcp_agent_wrapper.asyncio.new_event_loop')
-    def test_tool_call_hitl_with_valid_approval(self, mock_loop, mock_requests, mock_verify, client):
+    @patch('adapters.mcp.mcp_agent_wrapper.MCPAgentWrapper._run')
+    def test_tool_call_hitl_with_valid_approval(self, mock_run, mock_verify, client):
         """Test tool with valid HITL approval."""
         # Mock verification
         mock_verified = Mock()
@@ -213,15 +208,13 @@ class TestMCPAgentWrapper:
         mock_approval_response = Mock()
         mock_approval_response.status_code = 200
         mock_approval_response.json.return_value = {
+            'tool_name': 'write_file',
             'status': 'approved',
             'agent_id': 'test-agent'
         }
-        mock_requests.return_value = mock_approval_response
         
-        # Mock tool execution
-        mock_event_loop = Mock()
-        mock_loop.return_value = mock_event_loop
-        mock_event_loop.run_until_complete.return_value = {"success": True}
+        # Mock approval lookup, then tool execution
+        mock_run.side_effect = [mock_approval_response, {"success": True}]
         
         response = client.post('/v1/tools/call', json={
             'payload': {
@@ -236,7 +229,7 @@ class TestMCPAgentWrapper:
         assert data['status'] == 'success'
     
     @patch('adapters.mcp.mcp_agent_wrapper.verify_request')
-    @patch('adapters.mcp.mcp_agent_wrapper.requests.get')
+    @patch('adapters.mcp.mcp_agent_wrapper.httpx.AsyncClient.get', new_callable=AsyncMock)
     def test_tool_call_hitl_with_invalid_approval(self, mock_requests, mock_verify, client):
         """Test tool with invalid HITL approval."""
         mock_verified = Mock()
@@ -269,10 +262,11 @@ class TestMCPAgentWrapper:
     
     def test_verify_approval_success(self, wrapper):
         """Test successful approval verification."""
-        with patch('adapters.mcp.mcp_agent_wrapper.requests.get') as mock_get:
+        with patch('adapters.mcp.mcp_agent_wrapper.httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
+                'tool_name': 'write_file',
                 'status': 'approved',
                 'agent_id': 'test-agent'
             }
@@ -283,10 +277,11 @@ class TestMCPAgentWrapper:
     
     def test_verify_approval_wrong_agent(self, wrapper):
         """Test approval verification with wrong agent."""
-        with patch('adapters.mcp.mcp_agent_wrapper.requests.get') as mock_get:
+        with patch('adapters.mcp.mcp_agent_wrapper.httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
+                'tool_name': 'write_file',
                 'status': 'approved',
                 'agent_id': 'different-agent'
             }
@@ -297,10 +292,11 @@ class TestMCPAgentWrapper:
     
     def test_verify_approval_not_approved(self, wrapper):
         """Test approval verification with pending approval."""
-        with patch('adapters.mcp.mcp_agent_wrapper.requests.get') as mock_get:
+        with patch('adapters.mcp.mcp_agent_wrapper.httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
+                'tool_name': 'write_file',
                 'status': 'pending',
                 'agent_id': 'test-agent'
             }
@@ -308,6 +304,32 @@ class TestMCPAgentWrapper:
             
             result = wrapper._verify_approval('approval-123', 'write_file', 'test-agent')
             assert result == False
+    
+    def test_verify_approval_wrong_tool(self, wrapper):
+        """Test approval verification for a different tool."""
+        with patch('adapters.mcp.mcp_agent_wrapper.httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {
+                'tool_name': 'delete_file',
+                'status': 'approved',
+                'agent_id': 'test-agent'
+            }
+            mock_get.return_value = mock_response
+            
+            result = wrapper._verify_approval('approval-123', 'write_file', 'test-agent')
+            assert result == False
+    
+    def test_verify_approval_non_json_body(self, wrapper):
+        """Test approval verification with a non-JSON 200 response."""
+        with patch('adapters.mcp.mcp_agent_wrapper.httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.side_effect = ValueError("Expecting value")
+            mock_get.return_value = mock_response
+            
+            result = wrapper._verify_approval('approval-123', 'write_file', 'test-agent')
+            assert result == False
 
 
 class TestMCPAgentWrapperErrorHandling:
@@ -327,8 +349,8 @@ class TestMCPAgentWrapperErrorHandling:
         return wrapper.app.test_client()
     
     @patch('adapters.mcp.mcp_agent_wrapper.verify_request')
-    @patch('adapters.mcp.mcp_agent_wrapper.asyncio.new_event_loop')
-    def test_tool_call_timeout_error(self, mock_loop, mock_verify, client):
+    @patch('adapters.mcp.mcp_agent_wrapper.MCPAgentWrapper._run')
+    def test_tool_call_timeout_error(self, mock_run, mock_verify, client):
         """Test tool call with timeout error."""
         import subprocess
         
@@ -342,9 +364,7 @@ class TestMCPAgentWrapperErrorHandling:
         }
         mock_verify.return_value = mock_verified
         
-        mock_event_loop = Mock()
-        mock_loop.return_value = mock_event_loop
-        mock_event_loop.run_until_complete.side_effect = subprocess.TimeoutExpired("cmd", 30)
+        mock_run.side_effect = subprocess.TimeoutExpired("cmd", 30)
         
         response = client.post('/v1/tools/call', json={
             'payload': {'tool_name': 'slow_tool', 'arguments': {}}
@@ -355,8 +375,8 @@ class TestMCPAgentWrapperErrorHandling:
         assert 'timeout' in data['error'].lower()
     
     @patch('adapters.mcp.mcp_agent_wrapper.verify_request')
-    @patch('adapters.mcp.mcp_agent_wrapper.asyncio.new_event_loop')
-    def test_tool_call_connection_error(self, mock_loop, mock_verify, client):
+    @patch('adapters.mcp.mcp_agent_wrapper.MCPAgentWrapper._run')
+    def test_tool_call_connection_error(self, mock_run, mock_verify, client):
         """Test tool call with connection error."""
         mock_verified = Mock()
         mock_verified.agent_id = 'test-agent'
@@ -368,9 +388,7 @@ class TestMCPAgentWrapperErrorHandling:
         }
         mock_verify.return_value = mock_verified
         
-        mock_event_loop = Mock()
-        mock_loop.return_value = mock_event_loop
-        mock_event_loop.run_until_complete.side_effect = ConnectionError("Connection failed")
+        mock_run.side_effect = ConnectionError("Connection failed")
         
         response = client.post('/v1/tools/call', json={
             'payload': {'tool_name': 'broken_tool', 'arguments': {}}
@@ -0,0 +1,217 @@
+"""
+Unit tests for MCP client request multiplexing and the MCP pool
+
+Runs MCPClient against a small stub MCP server over stdio. The stub
+answers each request on its own thread, so responses can arrive out of
+order.
+
+Tests cover:
+- Concurrent calls over one process and out-of-order responses
+- EOF from the server failing pending calls with ConnectionError
+- Oversized responses failing only their own call
+- MCPPool round-robin and respawn of exited servers
+"""
+
+import asyncio
+import json
+import sys
+import textwrap
+
+import pytest
+
+from adapters.mcp.mcp_client import MCPClient, MCPPool
+
+STUB_SERVER = textwrap.dedent('''
+    import json, os, sys, threading, time
+
+    lock = threading.Lock()
+
+    def reply(msg_id, result, id_last=False):
+        if id_last:
+            message = {"result": result, "jsonrpc": "2.0", "id": msg_id}
+        else:
+            message = {"jsonrpc": "2.0", "id": msg_id, "result": result}
+        with lock:
+            sys.stdout.write(json.dumps(message) + "\\n")
+            sys.stdout.flush()
+
+    def handle(message):
+        params = message.get("params") or {}
+        if message["method"] == "tools/call":
+            if params["name"] == "exit":
+                os._exit(0)
+            args = params.get("arguments") or {}
+            time.sleep(args.get("delay", 0))
+            text = json.dumps({"n": args.get("n"), "pid": os.getpid(), "pad": "x" * args.get("size", 0)})
+            reply(message["id"], {"content": [{"type": "text", "text": text}]}, args.get("id_last", False))
+        elif message["method"] == "tools/list":
+            reply(message["id"], {"tools": [{"name": "echo", "inputSchema": {"type": "object"}}]})
+        else:
+            reply(message["id"], {})
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        if "id" in message:
+            threading.Thread(target=handle, args=(message,), daemon=True).start()
+''')
+
+
+def _payload(content):
+    """Decode the stub server's text content block."""
+    return json.loads(content[0]["text"])
+
+
+@pytest.fixture
+def command(tmp_path):
+    """Command line that starts the stub MCP server."""
+    script = tmp_path / "stub_mcp_server.py"
+    script.write_text(STUB_SERVER)
+    return [sys.executable, str(script)]
+
+
+class TestMCPClientMultiplexing:
+    """Test JSON-RPC id multiplexing in MCPClient."""
+    
+    def test_concurrent_calls_out_of_order(self, command):
+        """Test that each concurrent caller gets its own response, in any order."""
+        async def scenario():
+            finished = []
+            
+            async def call(n, delay):
+                result = await client.call_tool("echo", {"n": n, "delay": delay})
+                finished.append(n)
+                return _payload(result)["n"]
+            
+            async with MCPClient(command, "stub") as client:
+                results = await asyncio.wait_for(asyncio.gather(
+                    call(0, 0.6), call(1, 0.4), call(2, 0.2), call(3, 0.0)
+                ), timeout=10)
+                assert client._pending == {}
+            return results, finished
+        
+        results, finished = asyncio.run(scenario())
+        assert results == [0, 1, 2, 3]
+        assert finished == [3, 2, 1, 0]
+    
+    def test_list_tools(self, command):
+        """Test tool discovery through the reader task."""
+        async def scenario():
+            async with MCPClient(command, "stub") as client:
+                return await client.list_tools()
+        
+        tools = asyncio.run(scenario())
+        assert [tool.name for tool in tools] == ["echo"]
+    
+    def test_eof_fails_pending_calls(self, command):
+        """Test that the server closing stdout fails every pending call."""
+        async def scenario():
+            client = MCPClient(command, "stub")
+            await client.connect()
+            try:
+                slow = asyncio.create_task(client.call_tool("echo", {"n": 1, "delay": 30}))
+                await asyncio.sleep(0.1)
+                results = await asyncio.wait_for(asyncio.gather(
+                    slow, client.call_tool("exit", {}), return_exceptions=True
+                ), timeout=10)
+                return results, client.connected, client._pending
+            finally:
+                await client.disconnect()
+        
+        results, connected, pending = asyncio.run(scenario())
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert not connected
+        assert pending == {}
+
+    def test_large_response_within_limit(self, command):
+        """Test that multi-megabyte replies under the limit are delivered."""
+        async def scenario():
+            async with MCPClient(command, "stub") as client:
+                return await asyncio.wait_for(
+                    client.call_tool("echo", {"n": 1, "size": 2_000_000}), timeout=10
+                )
+        
+        assert len(_payload(asyncio.run(scenario()))["pad"]) == 2_000_000
+    
+    @pytest.mark.parametrize("id_last", [False, True])
+    def test_oversized_response_fails_only_its_call(self, command, id_last):
+        """Test that a reply over MAX_RESPONSE_BYTES fails its own call only."""
+        async def scenario():
+            client = MCPClient(command, "stub")
+            client.MAX_RESPONSE_BYTES = 64 * 1024
+            await client.connect()
+            try:
+                pid = client.process.pid
+                results = await asyncio.wait_for(asyncio.gather(
+                    client.call_tool("echo", {"n": 1, "size": 200_000, "delay": 0.1, "id_last": id_last}),
+                    client.call_tool("echo", {"n": 2, "delay": 0.3}),
+                    return_exceptions=True
+                ), timeout=10)
+                after = await asyncio.wait_for(client.call_tool("echo", {"n": 3}), timeout=10)
+                return results, after, client.connected, pid == client.process.pid
+            finally:
+                await client.disconnect()
+        
+        (big, small), after, connected, same_process = asyncio.run(scenario())
+        assert isinstance(big, ValueError)
+        assert "too large" in str(big)
+        assert _payload(small)["n"] == 2
+        assert _payload(after)["n"] == 3
+        assert connected
+        assert same_process
+
+
+class TestMCPPool:
+    """Test MCPPool round-robin checkout and respawn."""
+    
+    def test_round_robin(self, command):
+        """Test that checkouts rotate over the pooled processes."""
+        async def scenario():
+            pool = MCPPool(command, "stub", size=2)
+            await pool.warmup()
+            try:
+                pids = []
+                for n in range(4):
+                    async with pool.acquire() as client:
+                        pids.append(_payload(await client.call_tool("echo", {"n": n}))["pid"])
+                return pids
+            finally:
+                await pool.drain()
+        
+        pids = asyncio.run(scenario())
+        assert pids[0] != pids[1]
+        assert pids == [pids[0], pids[1], pids[0], pids[1]]
+    
+    def test_respawns_exited_server(self, command):
+        """Test that a client whose process exited is reconnected on checkout."""
+        async def scenario():
+            pool = MCPPool(command, "stub", size=1)
+            await pool.warmup()
+            try:
+                old_pid = pool.clients[0].process.pid
+                pool.clients[0].process.kill()
+                await pool.clients[0].process.wait()
+                await asyncio.sleep(0.05)
+                assert not pool.connected
+                
+                async with pool.acquire() as client:
+                    result = _payload(await client.call_tool("echo", {"n": 7}))
+                return old_pid, result, pool.connected
+            finally:
+                await pool.drain()
+        
+        old_pid, result, connected = asyncio.run(scenario())
+        assert result["n"] == 7
+        assert result["pid"] != old_pid
+        assert connected
+    
+    def test_drain_stops_all_processes(self, command):
+        """Test that drain() stops every pooled process."""
+        async def scenario():
+            pool = MCPPool(command, "stub", size=2)
+            await pool.warmup()
+            await pool.drain()
+            return [client.process.returncode for client in pool.clients], pool.connected
+        
+        returncodes, connected = asyncio.run(scenario())
+        assert all(code is not None for code in returncodes)
+        assert not connected
@@ -0,0 +1,90 @@
+"""
+Unit tests for the Redis token-bucket rate limiter
+
+Runs the real Lua script against fakeredis (with Lua support).
+
+Tests cover:
+- Bursting up to the limit
+- Continuous refill over time
+- The retry_after value returned when limited
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from adapters.cloud.redis_limiter import RedisRateLimiter
+
+T0 = 1_700_000_000.0
+
+
+class TestRedisTokenBucket:
+    """Test suite for RedisRateLimiter.check_limit."""
+    
+    @pytest.fixture
+    def clock(self):
+        """Controllable time.time() as seen by the limiter."""
+        now = [T0]
+        with patch('adapters.cloud.redis_limiter.time.time', side_effect=lambda: now[0]):
+            yield now
+    
+    @pytest.fixture
+    def limiter(self, clock):
+        """RedisRateLimiter backed by an in-process fake Redis."""
+        server = fakeredis.FakeServer()
+        with patch('adapters.cloud.redis_limiter.redis.Redis',
+                   side_effect=lambda **_: fakeredis.FakeRedis(server=server, decode_responses=True)):
+            limiter = RedisRateLimiter(fail_open=False)
+        assert limiter.redis_available
+        return limiter
+    
+    def test_burst_up_to_limit(self, limiter):
+        """Test that a full bucket allows exactly `limit` requests at once."""
+        results = [limiter.check_limit("agent-a", limit=5, window=60) for _ in range(6)]
+        
+        assert results[:5] == [(True, 0)] * 5
+        assert results[5][0] is False
+    
+    def test_retry_after_is_time_to_next_token(self, limiter, clock):
+        """Test retry_after when the bucket is empty."""
+        for _ in range(5):
+            limiter.check_limit("agent-a", limit=5, window=60)
+        
+        # One token every 60/5 = 12 seconds
+        assert limiter.check_limit("agent-a", limit=5, window=60) == (False, 12)
+        
+        clock[0] = T0 + 7.5
+        assert limiter.check_limit("agent-a", limit=5, window=60) == (False, 5)
+    
+    def test_refill_over_time(self, limiter, clock):
+        """Test that tokens refill continuously at limit/window per second."""
+        for _ in range(5):
+            limiter.check_limit("agent-a", limit=5, window=60)
+        
+        clock[0] = T0 + 12
+        assert limiter.check_limit("agent-a", limit=5, window=60) == (True, 0)
+        assert limiter.check_limit("agent-a", limit=5, window=60)[0] is False
+        
+        clock[0] = T0 + 36
+        assert limiter.check_limit("agent-a", limit=5, window=60) == (True, 0)
+        assert limiter.check_limit("agent-a", limit=5, window=60) == (True, 0)
+        assert limiter.check_limit("agent-a", limit=5, window=60)[0] is False
+    
+    def test_refill_is_capped_at_limit(self, limiter, clock):
+        """Test that an idle bucket never holds more than `limit` tokens."""
+        limiter.check_limit("agent-a", limit=5, window=60)
+        
+        clock[0] = T0 + 3600
+        results = [limiter.check_limit("agent-a", limit=5, window=60) for _ in range(6)]
+        assert [allowed for allowed, _ in results] == [True] * 5 + [False]
+    
+    def test_agents_have_separate_buckets(self, limiter):
+        """Test that one agent exhausting its bucket does not limit another."""
+        for _ in range(3):
+            limiter.check_limit("agent-a", limit=3, window=60)
+        
+        assert limiter.check_limit("agent-a", limit=3, window=60)[0] is False
+        assert limiter.check_limit("agent-b", limit=3, window=60) == (True, 0)
@@ -0,0 +1,228 @@
+"""
+Unit tests for SQLite transaction storage
+
+Tests cover:
+- Queued transaction logging (group commit) and read-your-writes
+- Draining the queue on close()
+- The read-only connection pool
+"""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from adapters.local.sqlite_storage import LocalSQLiteStorage
+
+
+def _tx(i):
+    """Build a minimal transaction row."""
+    return {
+        "transaction_id": f"tx_{i:04d}",
+        "consumer_agent_id": "agent_001",
+        "service_id": "svc_001",
+        "status": "success",
+        "result": {"n": i}
+    }
+
+
+class TestSQLiteGroupCommit:
+    """Test the background flusher behind log_transaction()."""
+    
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "test.db")
+    
+    @pytest.fixture
+    def storage(self, db_path):
+        """Create temporary SQLite storage, closed after the test."""
+        storage = LocalSQLiteStorage(db_path)
+        yield storage
+        storage.close()
+    
+    def test_enqueue_then_get_transaction(self, storage):
+        """Test that a queued transaction is visible to get_transaction()."""
+        storage.log_transaction(_tx(1))
+        
+        result = storage.get_transaction("tx_0001")
+        assert result is not None
+        assert result["status"] == "success"
+        assert result["result"] == {"n": 1}
+    
+    def test_close_commits_queued_transactions(self, db_path):
+        """Test that close() commits everything still queued."""
+        storage = LocalSQLiteStorage(db_path)
+        for i in range(200):
+            storage.log_transaction(_tx(i))
+        storage.close()
+        
+        reopened = LocalSQLiteStorage(db_path)
+        try:
+            assert reopened.get_transaction("tx_0000") is not None
+            assert reopened.get_transaction("tx_0199") is not None
+        finally:
+            reopened.close()
+    
+    def test_enqueue_get_close(self, db_path):
+        """Test enqueue, read-your-writes, then close with more rows queued."""
+        storage = LocalSQLiteStorage(db_path)
+        storage.log_transaction(_tx(1))
+        assert storage.get_transaction("tx_0001")["transaction_id"] == "tx_0001"
+        
+        storage.log_transaction(_tx(2))
+        storage.close()
+        
+        reopened = LocalSQLiteStorage(db_path)
+        try:
+            assert reopened.get_transaction("tx_0002") is not None
+        finally:
+            reopened.close()
+    
+    def test_read_not_starved_by_concurrent_writers(self, storage):
+        """Test that get_transaction() waits only for rows queued before it."""
+        stop = threading.Event()
+        
+        def writer(offset):
+            i = offset
+            while not stop.is_set():
+                storage.log_transaction(_tx(i))
+                i += 4
+        
+        storage.log_transaction(_tx(10_000))
+        with ThreadPoolExecutor(max_workers=5) as ex:
+            writers = [ex.submit(writer, offset) for offset in range(4)]
+            try:
+                reader = ex.submit(storage.get_transaction, "tx_10000")
+                result = reader.result(timeout=5)
+            finally:
+                stop.set()
+            for w in writers:
+                w.result(timeout=5)
+        
+        assert result["transaction_id"] == "tx_10000"
+    
+    def test_writes_after_close_are_committed(self, db_path):
+        """Test that writes arriving after close() are committed synchronously."""
+        storage = LocalSQLiteStorage(db_path)
+        storage.close()
+        
+        storage.log_transaction(_tx(1))
+        storage.log_transactions_bulk([_tx(2), _tx(3)])
+        storage.store_approval({
+            "approval_id": "apr_late",
+            "transaction_id": "tx_0001",
+            "agent_id": "agent_001",
+            "summary": "Late approval",
+            "created_at": "2024-01-01T00:00:00"
+        })
+        assert storage.get_transaction("tx_0001") is not None
+        
+        reopened = LocalSQLiteStorage(db_path)
+        try:
+            for tx_id in ("tx_0001", "tx_0002", "tx_0003"):
+                assert reopened.get_transaction(tx_id) is not None
+            assert reopened.get_approval("apr_late")["summary"] == "Late approval"
+        finally:
+            reopened.close()
+    
+    def test_sync_write(self, storage):
+        """Test that sync=True bypasses the queue."""
+        storage.log_transaction(_tx(7), sync=True)
+        assert storage._queue.unfinished_tasks == 0
+        assert storage.get_transaction("tx_0007") is not None
+    
+    def test_close_is_idempotent(self, storage):
+        """Test that a second close() is a no-op."""
+        storage.close()
+        storage.close()
+
+
+class TestSQLiteReadPool:
+    """Test the split writer / read-only reader connections."""
+    
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """Create temporary SQLite storage, closed after the test."""
+        storage = LocalSQLiteStorage(str(tmp_path / "test.db"))
+        yield storage
+        storage.close()
+    
+    def test_read_after_write_through_flush(self, storage):
+        """Test that a pooled reader sees rows once flush() returns."""
+        for i in range(10):
+            storage.log_transaction(_tx(i))
+        storage.flush()
+        
+        with storage._reader() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        assert count == 10
+    
+    def test_readers_are_read_only(self, storage):
+        """Test that pooled connections cannot write."""
+        with storage._reader() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM transactions")
+    
+    def test_pool_grows_to_concurrent_readers(self, storage):
+        """Test that simultaneous checkouts each open their own connection."""
+        storage._max_readers = 4
+        barrier = threading.Barrier(4)
+        
+        def hold_reader():
+            with storage._reader() as conn:
+                barrier.wait(timeout=5)
+                return id(conn)
+        
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            conns = list(ex.map(lambda _: hold_reader(), range(4)))
+        
+        assert len(set(conns)) == 4
+        assert storage._reader_count == 4
+    
+    def test_reader_waits_when_pool_exhausted(self, storage):
+        """Test that a reader beyond _max_readers waits for a free connection."""
+        storage._max_readers = 2
+        storage.log_transaction(_tx(1), sync=True)
+        checked_out = threading.Barrier(3)
+        release = threading.Event()
+        
+        def hold_reader():
+            with storage._reader():
+                checked_out.wait(timeout=5)
+                release.wait(timeout=5)
+        
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            holders = [ex.submit(hold_reader) for _ in range(2)]
+            checked_out.wait(timeout=5)
+            
+            waiter = ex.submit(storage.get_transaction, "tx_0001")
+            assert not release.wait(0.1)
+            assert not waiter.done()
+            assert storage._reader_count == 2
+            
+            release.set()
+            assert waiter.result(timeout=5)["transaction_id"] == "tx_0001"
+            for holder in holders:
+                holder.result(timeout=5)
+        
+        assert storage._reader_count == 2
+    
+    def test_concurrent_readers_exceeding_pool(self, storage):
+        """Test many concurrent readers sharing a small pool."""
+        storage._max_readers = 2
+        storage.log_transactions_bulk([_tx(i) for i in range(50)])
+        
+        def read_all(offset):
+            return [
+                storage.get_transaction(f"tx_{(offset + i) % 50:04d}")["result"]["n"]
+                for i in range(50)
+            ]
+        
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(read_all, range(8)))
+        
+        for offset, values in enumerate(results):
+            assert values == [(offset + i) % 50 for i in range(50)]
+        assert 1 <= storage._reader_count <= 2
+        assert storage._readers.qsize() == storage._reader_count